@@ -2,14 +2,15 @@
 
 We keep Django's default User model (good enough for now) and store
 location + preferences in a separate profile table.
+
+Profiles are created explicitly where users are created (registration,
+management commands); views fall back to get_or_create for older users.
 """
 
 from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
-from django.db.models.signals import post_save
-from django.dispatch import receiver
 
 
 class UserProfile(models.Model):
@@ -22,8 +23,8 @@ class UserProfile(models.Model):
 	postal_code = models.CharField(max_length=20, blank=True)
 	country = models.CharField(max_length=80, blank=True, default="CA")
 
-	latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
-	longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+	latitude = models.FloatField(null=True, blank=True)
+	longitude = models.FloatField(null=True, blank=True)
 
 	default_radius_km = models.PositiveIntegerField(
 		default=50,
@@ -40,8 +41,11 @@ class UserProfile(models.Model):
 	def __str__(self) -> str:
 		return f"Profile: {self.user.username}"
 
-
-@receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def create_profile_for_new_user(sender, instance, created, **kwargs):
-	if created:
-		UserProfile.objects.create(user=instance)
+	@classmethod
+	def for_request(cls, request) -> "UserProfile":
+		"""Return the signed-in user's profile, loading (or creating) it once per request."""
+		profile = getattr(request, "_user_profile", None)
+		if profile is None:
+			profile, _ = cls.objects.get_or_create(user=request.user)
+			request._user_profile = profile
+		return profile
@@ -5,6 +5,7 @@ from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect, render
 
 from .forms import RegisterForm
+from .models import UserProfile
 
 
 def register(request):
@@ -12,6 +13,7 @@ def register(request):
 		form = RegisterForm(request.POST)
 		if form.is_valid():
 			user = form.save()
+			UserProfile.objects.create(user=user)
 			login(request, user)
 			return redirect("dashboard")
 	else:
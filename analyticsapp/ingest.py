@@ -0,0 +1,108 @@
+"""Analytics event ingestion.
+
+By default every event (search or usage) is a plain INSERT on the request
+thread. With ANALYTICS_BUFFERED=True, events are queued in-process and written
+with bulk_create once ANALYTICS_BUFFER_SIZE events are waiting or
+ANALYTICS_FLUSH_SECONDS have passed, whichever comes first.
+
+Buffered events that haven't been flushed are lost if the process is killed;
+that's acceptable for analytics, not for anything else.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import connections, transaction
+
+from analyticsapp.models import SearchEvent, SearchRollup, UsageEvent
+
+logger = logging.getLogger(__name__)
+
+_buffer: deque[SearchEvent | UsageEvent] = deque()
+_lock = threading.Lock()
+_timer: threading.Timer | None = None
+
+
+def _buffered() -> bool:
+	return bool(getattr(settings, "ANALYTICS_BUFFERED", False))
+
+
+def record_search(**fields) -> None:
+	"""Record a SearchEvent (immediately, or via the buffer when enabled)."""
+	if not _buffered():
+		SearchEvent.objects.create(**fields)
+		return
+	_enqueue(SearchEvent(**fields))
+
+
+def record_usage(**fields) -> None:
+	"""Record a UsageEvent (immediately, or via the buffer when enabled)."""
+	if not _buffered():
+		UsageEvent.objects.create(**fields)
+		return
+	_enqueue(UsageEvent(**fields))
+
+
+def _enqueue(event: SearchEvent | UsageEvent) -> None:
+	_buffer.append(event)
+	if len(_buffer) >= getattr(settings, "ANALYTICS_BUFFER_SIZE", 100):
+		# Write in the background so a DB error never fails the unrelated request
+		# that happened to fill the buffer.
+		threading.Thread(target=_flush_from_timer, daemon=True).start()
+	else:
+		_schedule_flush()
+
+
+def _schedule_flush() -> None:
+	global _timer
+	with _lock:
+		if _timer is not None:
+			return
+		_timer = threading.Timer(getattr(settings, "ANALYTICS_FLUSH_SECONDS", 2.0), _flush_from_timer)
+		_timer.daemon = True
+		_timer.start()
+
+
+def _flush_from_timer() -> None:
+	try:
+		flush()
+	except Exception:
+		# Analytics must never take down a worker; the batch is dropped.
+		logger.exception("Failed to flush buffered analytics events")
+	finally:
+		# The timer thread opened its own DB connection.
+		connections.close_all()
+
+
+def flush() -> int:
+	"""Write all buffered events. Returns the number of rows written."""
+	global _timer
+	with _lock:
+		if _timer is not None:
+			_timer.cancel()
+			_timer = None
+		batch = []
+		while _buffer:
+			batch.append(_buffer.popleft())
+
+	if not batch:
+		return 0
+	searches = [e for e in batch if isinstance(e, SearchEvent)]
+	usages = [e for e in batch if isinstance(e, UsageEvent)]
+	if searches:
+		# bulk_create skips post_save, so keep the rollup in sync here, in the
+		# same transaction so stored events are always counted.
+		with transaction.atomic():
+			SearchEvent.objects.bulk_create(searches, batch_size=500)
+			SearchRollup.record(searches)
+	if usages:
+		UsageEvent.objects.bulk_create(usages, batch_size=500)
+	return len(batch)
+
+
+atexit.register(_flush_from_timer)
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyticsapp', '0001_initial'),
+        ('directory', '0003_provider_settings'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='searchevent',
+            index=models.Index(fields=['state', 'created_at'], name='analyticsap_state_52ef47_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchevent',
+            index=models.Index(fields=['city', 'state', 'created_at'], name='analyticsap_city_470433_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchevent',
+            index=models.Index(fields=['created_at'], name='analyticsap_created_3408a3_idx'),
+        ),
+    ]
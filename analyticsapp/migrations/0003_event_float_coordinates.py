@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyticsapp', '0002_searchevent_location_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchevent',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='searchevent',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='usageevent',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='usageevent',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:40
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    SearchEvent = apps.get_model('analyticsapp', 'SearchEvent')
+    SearchRollup = apps.get_model('analyticsapp', 'SearchRollup')
+    rows = (
+        SearchEvent.objects.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('day', 'state', 'city', 'postal_code')
+        .annotate(n=Count('id'))
+    )
+    SearchRollup.objects.bulk_create((SearchRollup(**row) for row in rows), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyticsapp', '0003_event_float_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('state', models.CharField(blank=True, max_length=80)),
+                ('city', models.CharField(blank=True, max_length=80)),
+                ('postal_code', models.CharField(blank=True, max_length=20)),
+                ('n', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'state', 'city', 'postal_code'), name='searchrollup_unique_bucket')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
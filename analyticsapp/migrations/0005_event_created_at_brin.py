@@ -0,0 +1,48 @@
+# BRIN indexes on the append-only event tables (PostgreSQL only).
+#
+# BRIN stores min/max created_at per block range, so it stays tiny while still
+# letting the planner skip old blocks for `created_at >= cutoff`. On
+# PostgreSQL the SearchEvent btree on created_at (0002) is dropped in its
+# favour, so inserts stop paying for both; other backends keep the btree.
+
+from django.db import migrations
+
+BRIN_INDEXES = [
+    ('analyticsapp_searchevent', 'se_created_brin'),
+    ('analyticsapp_usageevent', 'ue_created_brin'),
+]
+# Index(fields=['created_at']) on SearchEvent, superseded by se_created_brin.
+CREATED_AT_BTREE = ('analyticsapp_searchevent', 'analyticsap_created_3408a3_idx')
+
+
+def create_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, name in BRIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING BRIN (created_at)'
+        )
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {CREATED_AT_BTREE[1]}')
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table, name = CREATED_AT_BTREE
+    schema_editor.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} (created_at)')
+    for _table, name in BRIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('analyticsapp', '0004_searchrollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_indexes, drop_brin_indexes),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyticsapp', '0005_event_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='searchevent',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='usageevent',
+            options={},
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Take the SearchEvent created_at btree out of the model state.
+#
+# 0005 replaces it with a BRIN index on PostgreSQL, so declaring it in
+# Meta.indexes described an index that doesn't exist there. Other backends
+# keep the btree (from 0002), now created here under the same name.
+
+from django.db import migrations
+
+INDEX_NAME = 'analyticsap_created_3408a3_idx'
+TABLE = 'analyticsapp_searchevent'
+
+
+def create_btree_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        return
+    schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON {TABLE} (created_at)')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyticsapp', '0006_event_no_default_ordering'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(model_name='searchevent', name=INDEX_NAME),
+            ],
+            database_operations=[
+                # Going back to 0006 re-declares the index, which still exists
+                # on non-PostgreSQL backends, so there is nothing to undo.
+                migrations.RunPython(create_btree_index, migrations.RunPython.noop),
+            ],
+        ),
+    ]
@@ -3,13 +3,24 @@
 We track two key concepts:
 - SearchEvent: what users are requesting (intent)
 - UsageEvent: what users actually use/contact (behavior)
+
+SearchRollup keeps per-day location counts of SearchEvents so reports don't
+have to scan the whole event table.
 """
 
 from __future__ import annotations
 
+from collections import Counter
+from typing import Iterable
+
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
 
+from analyticsapp.reporting import invalidate_reports_cache
 from directory.models import ServiceCategory, ServiceProvider
 
 
@@ -24,16 +35,20 @@ class SearchEvent(models.Model):
 	city = models.CharField(max_length=80, blank=True)
 	state = models.CharField(max_length=80, blank=True)
 	postal_code = models.CharField(max_length=20, blank=True)
-	latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
-	longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+	latitude = models.FloatField(null=True, blank=True)
+	longitude = models.FloatField(null=True, blank=True)
 
 	created_at = models.DateTimeField(auto_now_add=True)
 
 	class Meta:
-		ordering = ["-created_at"]
 		indexes = [
 			models.Index(fields=["service_category", "created_at"]),
 			models.Index(fields=["postal_code", "created_at"]),
+			# Location group-bys in analyticsapp.reporting.
+			models.Index(fields=["state", "created_at"]),
+			models.Index(fields=["city", "state", "created_at"]),
+			# created_at is indexed per backend in migrations, not here: BRIN on
+			# PostgreSQL (0005), a plain btree elsewhere (0007).
 		]
 
 	def __str__(self) -> str:
@@ -61,13 +76,12 @@ class UsageEvent(models.Model):
 	city = models.CharField(max_length=80, blank=True)
 	state = models.CharField(max_length=80, blank=True)
 	postal_code = models.CharField(max_length=20, blank=True)
-	latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
-	longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+	latitude = models.FloatField(null=True, blank=True)
+	longitude = models.FloatField(null=True, blank=True)
 
 	created_at = models.DateTimeField(auto_now_add=True)
 
 	class Meta:
-		ordering = ["-created_at"]
 		indexes = [
 			models.Index(fields=["service_category", "action", "created_at"]),
 			models.Index(fields=["provider", "action", "created_at"]),
@@ -76,3 +90,61 @@ class UsageEvent(models.Model):
 	def __str__(self) -> str:
 		provider_name = self.provider.name if self.provider else "(no provider)"
 		return f"Usage: {self.action} {provider_name}"
+
+
+class SearchRollup(models.Model):
+	"""Number of searches per (day, state, city, postal code)."""
+
+	day = models.DateField()
+	state = models.CharField(max_length=80, blank=True)
+	city = models.CharField(max_length=80, blank=True)
+	postal_code = models.CharField(max_length=20, blank=True)
+	n = models.BigIntegerField(default=0)
+
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(fields=["day", "state", "city", "postal_code"], name="searchrollup_unique_bucket"),
+		]
+
+	def __str__(self) -> str:
+		return f"{self.day} {self.city} {self.state} {self.postal_code}: {self.n}"
+
+	@classmethod
+	def record(cls, events: Iterable[SearchEvent], *, delta: int = 1) -> None:
+		"""Add (or with delta=-1, remove) saved events to their day/location buckets."""
+		buckets = Counter(
+			(timezone.localdate(e.created_at), e.state, e.city, e.postal_code) for e in events if e.created_at
+		)
+		for (day, state, city, postal_code), count in buckets.items():
+			key = {"day": day, "state": state, "city": city, "postal_code": postal_code}
+			updated = cls.objects.filter(**key).update(n=F("n") + count * delta)
+			if updated or delta < 0:
+				continue
+			try:
+				with transaction.atomic():
+					cls.objects.create(n=count, **key)
+			except IntegrityError:
+				# Another request created the bucket first.
+				cls.objects.filter(**key).update(n=F("n") + count)
+
+
+@receiver(post_save, sender=SearchEvent)
+def add_search_to_rollup(sender, instance, created, **kwargs):
+	if created:
+		SearchRollup.record([instance])
+
+
+@receiver(post_delete, sender=SearchEvent)
+def remove_search_from_rollup(sender, instance, **kwargs):
+	SearchRollup.record([instance], delta=-1)
+
+
+@receiver(post_save, sender=SearchEvent)
+@receiver(post_delete, sender=SearchEvent)
+@receiver(post_save, sender=UsageEvent)
+@receiver(post_delete, sender=UsageEvent)
+def invalidate_reports_on_event_change(sender, created=False, **kwargs):
+	# New events only show up once the reports cache expires; bumping the version on
+	# every insert would keep it from ever hitting. Edits and deletes are rare.
+	if not created:
+		invalidate_reports_cache()
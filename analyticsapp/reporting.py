@@ -1,9 +1,94 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
+from django.core.cache import cache
+
 ReportsContext = dict[str, object]
 
+# Reports change slowly; the admin index panel renders them on every page load.
+REPORTS_CACHE_TIMEOUT = 60 * 5
+_REPORTS_CACHE_VERSION_KEY = "analytics:reports:version"
+REPORTS_QUERY_WORKERS = 4
+
+
+def _reports_cache_key(days: int) -> str:
+	version = cache.get_or_set(_REPORTS_CACHE_VERSION_KEY, 1, timeout=None)
+	return f"analytics:reports:v1:{version}:{days}"
+
+
+def invalidate_reports_cache() -> None:
+	"""Drop every cached reports context (all `days` windows)."""
+	try:
+		cache.incr(_REPORTS_CACHE_VERSION_KEY)
+	except ValueError:
+		# No version stored yet, so nothing is cached.
+		pass
+
+
+def _fetch_rows(qs) -> list:
+	from django.db import connections
+
+	try:
+		return list(qs)
+	finally:
+		# Worker threads open their own DB connection; don't leak it.
+		connections.close_all()
+
+
+def _evaluate_querysets(querysets: list) -> list[list]:
+	"""Evaluate independent querysets, concurrently when the backend benefits.
+
+	SQLite serializes on one file lock, so there it's plain sequential list().
+	"""
+	from django.db import connection
+
+	if connection.vendor == "sqlite":
+		return [list(qs) for qs in querysets]
+	with ThreadPoolExecutor(max_workers=REPORTS_QUERY_WORKERS) as executor:
+		return list(executor.map(_fetch_rows, querysets))
+
+
+def _count_unique_users(cutoff) -> tuple[int, int]:
+	"""Distinct signed-in users across both event tables: (all time, since cutoff)."""
+	from django.db import connection
+
+	from analyticsapp.models import SearchEvent, UsageEvent
+
+	if connection.vendor == "postgresql":
+		# One pass over both tables; FILTER yields the windowed count alongside.
+		sql = (
+			"SELECT COUNT(DISTINCT user_id), COUNT(DISTINCT user_id) FILTER (WHERE created_at >= %s) "
+			f"FROM (SELECT user_id, created_at FROM {SearchEvent._meta.db_table} WHERE user_id IS NOT NULL "
+			f"UNION ALL SELECT user_id, created_at FROM {UsageEvent._meta.db_table} WHERE user_id IS NOT NULL) t"
+		)
+		with connection.cursor() as cursor:
+			cursor.execute(sql, [cutoff])
+			users_all, users_30 = cursor.fetchone()
+		return users_all, users_30
+
+	# UNION (not UNION ALL) dedupes user ids in the database instead of in Python.
+	search_users = SearchEvent.objects.exclude(user__isnull=True).order_by().values("user_id")
+	usage_users = UsageEvent.objects.exclude(user__isnull=True).order_by().values("user_id")
+	users_all = search_users.union(usage_users).count()
+	users_30 = (
+		search_users.filter(created_at__gte=cutoff)
+		.union(usage_users.filter(created_at__gte=cutoff))
+		.count()
+	)
+	return users_all, users_30
+
+
+def _with_names(rows: list[dict], id_key: str, model, name_key: str) -> list[dict]:
+	"""Swap `id_key` in grouped rows for the related object's name under `name_key`."""
+	objs = model.objects.only("name").in_bulk([r[id_key] for r in rows if r[id_key] is not None])
+	out = []
+	for r in rows:
+		obj = objs.get(r[id_key])
+		out.append({name_key: obj.name if obj is not None else None, "total": r["total"]})
+	return out
+
 
 def build_reports_context(*, days: int = 30) -> ReportsContext:
 	"""Build the analytics context used by the admin reports views/templates.
@@ -11,90 +96,144 @@ def build_reports_context(*, days: int = 30) -> ReportsContext:
 	Keep this logic in one place so it can be reused by:
 	- /admin/reports/ view
 	- admin index panel (template tag)
+
+	Results are cached for REPORTS_CACHE_TIMEOUT seconds. New events appear
+	once that expires; edits and deletes invalidate the cache right away.
 	"""
-	from django.db.models import Count
+	key = _reports_cache_key(days)
+	ctx = cache.get(key)
+	if ctx is None:
+		ctx = _compute_reports_context(days=days)
+		cache.set(key, ctx, timeout=REPORTS_CACHE_TIMEOUT)
+	return ctx
+
+
+def _compute_reports_context(*, days: int) -> ReportsContext:
+	from django.db.models import Count, Q, Sum
 	from django.utils import timezone
 
-	from analyticsapp.models import SearchEvent, UsageAction, UsageEvent
+	from analyticsapp.models import SearchEvent, SearchRollup, UsageAction, UsageEvent
+	from directory.models import ServiceCategory, ServiceProvider
 
 	cutoff = timezone.now() - timedelta(days=days)
 
 	top_requested = (
-		SearchEvent.objects.values("service_category__name")
+		SearchEvent.objects.values("service_category_id")
 		.annotate(total=Count("id"))
 		.order_by("-total")[:10]
 	)
 
 	top_used = (
 		UsageEvent.objects.filter(action__in=[UsageAction.CONTACT, UsageAction.CLICK_WEBSITE])
-		.values("provider__name")
+		.values("provider_id")
 		.annotate(total=Count("id"))
 		.order_by("-total")[:10]
 	)
 
-	search_events_all = SearchEvent.objects.all()
-	usage_events_all = UsageEvent.objects.all()
-	search_events_30 = search_events_all.filter(created_at__gte=cutoff)
-	usage_events_30 = usage_events_all.filter(created_at__gte=cutoff)
+	recent = Q(created_at__gte=cutoff)
+	# One aggregate per table instead of a separate COUNT query per number.
+	search_totals = SearchEvent.objects.aggregate(
+		count_all=Count("id"),
+		count_30=Count("id", filter=recent),
+		users_all=Count("user", distinct=True),
+		users_30=Count("user", distinct=True, filter=recent),
+	)
+	usage_totals = UsageEvent.objects.aggregate(
+		count_all=Count("id"),
+		count_30=Count("id", filter=recent),
+		users_all=Count("user", distinct=True),
+		users_30=Count("user", distinct=True, filter=recent),
+	)
 
-	unique_search_users_all = search_events_all.exclude(user__isnull=True).values("user_id").distinct().count()
-	unique_usage_users_all = usage_events_all.exclude(user__isnull=True).values("user_id").distinct().count()
-	unique_search_users_30 = search_events_30.exclude(user__isnull=True).values("user_id").distinct().count()
-	unique_usage_users_30 = usage_events_30.exclude(user__isnull=True).values("user_id").distinct().count()
+	unique_search_users_all = search_totals["users_all"]
+	unique_usage_users_all = usage_totals["users_all"]
+	unique_search_users_30 = search_totals["users_30"]
+	unique_usage_users_30 = usage_totals["users_30"]
 
-	user_ids_all = set(search_events_all.exclude(user__isnull=True).values_list("user_id", flat=True).distinct())
-	user_ids_all.update(usage_events_all.exclude(user__isnull=True).values_list("user_id", flat=True).distinct())
-	unique_users_all = len(user_ids_all)
+	unique_users_all, unique_users_30 = _count_unique_users(cutoff)
 
-	user_ids_30 = set(search_events_30.exclude(user__isnull=True).values_list("user_id", flat=True).distinct())
-	user_ids_30.update(usage_events_30.exclude(user__isnull=True).values_list("user_id", flat=True).distinct())
-	unique_users_30 = len(user_ids_30)
+	search_events_count_all = search_totals["count_all"]
+	usage_events_count_all = usage_totals["count_all"]
+	search_events_count_30 = search_totals["count_30"]
+	usage_events_count_30 = usage_totals["count_30"]
 
-	search_events_count_all = search_events_all.count()
-	usage_events_count_all = usage_events_all.count()
-	search_events_count_30 = search_events_30.count()
-	usage_events_count_30 = usage_events_30.count()
+	# Location lists read the daily rollup, so their cost tracks the number of
+	# distinct (day, location) buckets rather than the number of events.
+	# Rollups are bucketed by local date, so the window is whole local days
+	# starting on the cutoff's local date.
+	rollups_all = SearchRollup.objects.all()
+	rollups_since = timezone.localdate(cutoff)
+	rollups_30 = rollups_all.filter(day__gte=rollups_since)
 
 	top_states_30 = (
-		search_events_30.exclude(state="")
+		rollups_30.filter(state__gt="")
 		.values("state")
-		.annotate(total=Count("id"))
+		.annotate(total=Sum("n"))
 		.order_by("-total")[:10]
 	)
 	# Keep other precomputed lists available for the full reports page.
 	top_states_all = (
-		search_events_all.exclude(state="")
+		rollups_all.filter(state__gt="")
 		.values("state")
-		.annotate(total=Count("id"))
+		.annotate(total=Sum("n"))
 		.order_by("-total")[:10]
 	)
 
 	top_cities_30 = (
-		search_events_30.exclude(city="").exclude(state="")
+		rollups_30.filter(city__gt="", state__gt="")
 		.values("city", "state")
-		.annotate(total=Count("id"))
+		.annotate(total=Sum("n"))
 		.order_by("-total")[:10]
 	)
 	top_cities_all = (
-		search_events_all.exclude(city="").exclude(state="")
+		rollups_all.filter(city__gt="", state__gt="")
 		.values("city", "state")
-		.annotate(total=Count("id"))
+		.annotate(total=Sum("n"))
 		.order_by("-total")[:10]
 	)
 
 	top_postal_30 = (
-		search_events_30.exclude(postal_code="")
+		rollups_30.filter(postal_code__gt="")
 		.values("postal_code")
-		.annotate(total=Count("id"))
+		.annotate(total=Sum("n"))
 		.order_by("-total")[:10]
 	)
 	top_postal_all = (
-		search_events_all.exclude(postal_code="")
+		rollups_all.filter(postal_code__gt="")
 		.values("postal_code")
-		.annotate(total=Count("id"))
+		.annotate(total=Sum("n"))
 		.order_by("-total")[:10]
 	)
 
+	# Materialize the top-N lists so templates iterating them twice (or checking
+	# truthiness first) reuse one result set.
+	(
+		top_requested,
+		top_used,
+		top_states_all,
+		top_states_30,
+		top_cities_all,
+		top_cities_30,
+		top_postal_all,
+		top_postal_30,
+	) = _evaluate_querysets(
+		[
+			top_requested,
+			top_used,
+			top_states_all,
+			top_states_30,
+			top_cities_all,
+			top_cities_30,
+			top_postal_all,
+			top_postal_30,
+		]
+	)
+
+	# Grouping on the FK column keeps the aggregates on the event tables; the
+	# handful of names is resolved afterwards by primary key.
+	top_requested = _with_names(top_requested, "service_category_id", ServiceCategory, "service_category__name")
+	top_used = _with_names(top_used, "provider_id", ServiceProvider, "provider__name")
+
 	return {
 		"top_requested": top_requested,
 		"top_used": top_used,
@@ -114,4 +253,5 @@ def build_reports_context(*, days: int = 30) -> ReportsContext:
 		"top_cities_30": top_cities_30,
 		"top_postal_all": top_postal_all,
 		"top_postal_30": top_postal_30,
+		"rollups_since": rollups_since,
 	}
@@ -1,3 +1,28 @@
-from django.test import TestCase
+from datetime import date, datetime, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from analyticsapp.models import SearchRollup
+from analyticsapp.reporting import build_reports_context
+
+
+@override_settings(TIME_ZONE="America/Winnipeg")
+class ReportsRollupWindowTests(TestCase):
+	def setUp(self):
+		cache.clear()
+
+	def test_location_window_starts_on_the_cutoff_local_date(self):
+		# 30 days before this is 2026-03-01 03:00 UTC, i.e. 2026-02-28 21:00 in Winnipeg.
+		now = datetime(2026, 3, 31, 3, 0, tzinfo=dt_timezone.utc)
+		SearchRollup.objects.create(day=date(2026, 2, 27), state="ON", n=5)
+		SearchRollup.objects.create(day=date(2026, 2, 28), state="MB", n=2)
+		SearchRollup.objects.create(day=date(2026, 3, 30), state="SK", n=1)
+
+		with mock.patch("django.utils.timezone.now", return_value=now):
+			ctx = build_reports_context(days=30)
+
+		self.assertEqual(ctx["rollups_since"], date(2026, 2, 28))
+		self.assertEqual([row["state"] for row in ctx["top_states_30"]], ["MB", "SK"])
+		self.assertEqual(ctx["top_states_all"][0], {"state": "ON", "total": 5})
@@ -148,12 +148,31 @@ USE_TZ = True
 
 
 # Cache (used to reduce free API calls)
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "local-services-cache",
+# LocMemCache is per-process; with several gunicorn workers set REDIS_URL so
+# all workers share one cache (e.g. redis://127.0.0.1:6379/0).
+REDIS_URL = env("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+        # Small per-process tier in front of Redis for hot provider results,
+        # so repeat searches on a worker skip the network round trip.
+        "local": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "local-services-hot",
+            "TIMEOUT": 60 * 5,
+            "OPTIONS": {"MAX_ENTRIES": 1024},
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "local-services-cache",
+        }
     }
-}
 
 
 # Static files (CSS, JavaScript, Images)
@@ -181,9 +200,17 @@ OSM_OVERPASS_URL = env("OSM_OVERPASS_URL", default="https://overpass-api.de/api/
 OSM_USER_AGENT = env("OSM_USER_AGENT", default="local-services-local-dev")
 OSM_CONTACT_EMAIL = env("OSM_CONTACT_EMAIL", default="")
 OSM_DEFAULT_RADIUS_KM = env.int("OSM_DEFAULT_RADIUS_KM", default=50)
+# Refuse to download/parse provider responses bigger than this (bytes).
+OSM_MAX_RESPONSE_BYTES = env.int("OSM_MAX_RESPONSE_BYTES", default=4_000_000)
 
 GOOGLE_MAPS_API_KEY = env("GOOGLE_MAPS_API_KEY", default="")
 
+# Analytics writes: buffer SearchEvents in-process and bulk insert them.
+# Off by default so local dev/tests see rows immediately.
+ANALYTICS_BUFFERED = env.bool("ANALYTICS_BUFFERED", default=False)
+ANALYTICS_BUFFER_SIZE = env.int("ANALYTICS_BUFFER_SIZE", default=100)
+ANALYTICS_FLUSH_SECONDS = env.float("ANALYTICS_FLUSH_SECONDS", default=2.0)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
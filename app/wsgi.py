@@ -8,24 +8,83 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 """
 
 import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
 
-from django.core.management import call_command
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
 
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 
 def _truthy(value: str) -> bool:
 	return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _marker_path() -> str:
+	"""Where we record that startup tasks finished for the current migrations.
+
+	Defaults to a file next to the SQLite DB, so it lives and dies with the data.
+	"""
+	from django.conf import settings
+
+	default = Path(str(settings.DATABASES["default"]["NAME"])).parent / ".local_services_startup_done"
+	return os.environ.get("STARTUP_TASK_MARKER", str(default))
+
+
+def _latest_migration_mtime() -> float:
+	return max((p.stat().st_mtime for p in BASE_DIR.glob("*/migrations/0*.py")), default=0.0)
+
+
+def _startup_tasks_up_to_date(marker_path: str) -> bool:
+	try:
+		return os.stat(marker_path).st_mtime >= _latest_migration_mtime()
+	except OSError:
+		return False
+
+
+def _run_startup_commands(commands: list[list[str]], marker_path: str) -> None:
+	manage_py = str(BASE_DIR / "manage.py")
+	for args in commands:
+		result = subprocess.run([sys.executable, manage_py, *args], cwd=str(BASE_DIR), check=False)
+		if result.returncode != 0:
+			# Leave the marker alone so the next start retries.
+			return
+	try:
+		Path(marker_path).touch()
+	except OSError:
+		pass
+
+
 def _maybe_run_startup_tasks() -> None:
 	"""Optional startup tasks for demo deployments.
 
-	NOTE: Running migrations at import time is not recommended for real production.
+	NOTE: Running migrations from the web process is not recommended for real
+	production; run `manage.py migrate` as a release/pre-start step instead.
 	For a demo deploy (single service), it prevents "no such table" errors when the
 	platform doesn't run `manage.py migrate` as part of the start command.
+
+	The commands run in a subprocess from a background thread, so the worker
+	starts serving immediately instead of waiting on schema work.
 	"""
+	commands: list[list[str]] = []
+	if _truthy(os.environ.get("AUTO_MIGRATE_ON_STARTUP", "")):
+		commands.append(["migrate", "--noinput", "--verbosity", "1"])
+	if _truthy(os.environ.get("AUTO_CREATE_DEMO_ADMIN_ON_STARTUP", "")):
+		commands.append(["ensure_demo_admin", "--verbosity", "1"])
+	if _truthy(os.environ.get("AUTO_SEED_DEMO_ON_STARTUP", "")):
+		commands.append(["seed_demo", "--verbosity", "1"])
+	if not commands:
+		return
+
+	# Fast path: a previous start already ran these against the current migrations.
+	marker_path = _marker_path()
+	if _startup_tasks_up_to_date(marker_path):
+		return
+
 	# Avoid multiple gunicorn workers racing migrations.
 	# We use an atomic lock file create on Linux (/tmp).
 	lock_path = os.environ.get("STARTUP_TASK_LOCKFILE", "/tmp/local_services_startup.lock")
@@ -48,17 +107,12 @@ def _maybe_run_startup_tasks() -> None:
 				pass
 
 	try:
-		auto_migrate = os.environ.get("AUTO_MIGRATE_ON_STARTUP", "")
-		if _truthy(auto_migrate):
-			call_command("migrate", interactive=False, verbosity=1)
-
-		auto_admin = os.environ.get("AUTO_CREATE_DEMO_ADMIN_ON_STARTUP", "")
-		if _truthy(auto_admin):
-			call_command("ensure_demo_admin", verbosity=1)
-
-		auto_seed = os.environ.get("AUTO_SEED_DEMO_ON_STARTUP", "")
-		if _truthy(auto_seed):
-			call_command("seed_demo", verbosity=1)
+		threading.Thread(
+			target=_run_startup_commands,
+			args=(commands, marker_path),
+			name="startup-tasks",
+			daemon=True,
+		).start()
 	except Exception:
 		# Demo convenience only; never prevent the server from starting.
 		pass
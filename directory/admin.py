@@ -7,11 +7,13 @@ from .models import ProviderSettings, ServiceCategory, ServiceProvider
 @admin.action(description="Mark selected categories as active")
 def mark_categories_active(modeladmin, request, queryset):
 	queryset.update(is_active=True)
+	ServiceCategory.invalidate_choices()
 
 
 @admin.action(description="Mark selected categories as inactive")
 def mark_categories_inactive(modeladmin, request, queryset):
 	queryset.update(is_active=False)
+	ServiceCategory.invalidate_choices()
 
 
 @admin.register(ServiceCategory)
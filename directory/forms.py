@@ -30,10 +30,11 @@ class LocationForm(forms.Form):
 
 
 class ServiceSearchForm(forms.Form):
-    service_category = forms.ModelChoiceField(
-        queryset=ServiceCategory.objects.none(),
+    service_category = forms.TypedChoiceField(
+        coerce=int,
+        empty_value=None,
         required=False,
-        empty_label="All services",
+        choices=[("", "All services")],
     )
     query = forms.CharField(
         max_length=120,
@@ -53,11 +54,20 @@ class ServiceSearchForm(forms.Form):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
-            # Important: building a QuerySet doesn't hit the DB.
-            # We force a tiny evaluation to confirm the table exists.
-            qs = ServiceCategory.objects.filter(is_active=True)
-            list(qs.values_list("id", flat=True)[:1])
-            self.fields["service_category"].queryset = qs
+            # Options come from the cached (id, name) list, so rendering them
+            # doesn't touch the DB; clean_service_category() still loads the pick.
+            choices = ServiceCategory.active_choices()
         except (OperationalError, ProgrammingError):
-            # Database not migrated yet.
-            self.fields["service_category"].queryset = ServiceCategory.objects.none()
+            # Table not migrated yet.
+            choices = []
+        self.fields["service_category"].choices = [("", "All services"), *choices]
+
+    def clean_service_category(self):
+        pk = self.cleaned_data.get("service_category")
+        if pk is None:
+            return None
+        # Views and provider backends only read id/name/slug off the category.
+        category = ServiceCategory.objects.filter(pk=pk, is_active=True).only("id", "name", "slug").first()
+        if category is None:
+            raise forms.ValidationError("Select a valid choice. That choice is not one of the available choices.", code="invalid_choice")
+        return category
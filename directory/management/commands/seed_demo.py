@@ -1,15 +1,206 @@
 """Seed starter data for local development.
 
-This command is safe to re-run (it uses get_or_create).
+This command is safe to re-run: categories are looked up first and only
+missing ones are inserted, and demo providers are upserted on (category, name).
+Everything runs in one transaction.
 """
 
+from types import MappingProxyType
+
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
 
 from accounts.models import UserProfile
-from directory.models import ProviderBackendChoice, ProviderSettings, ServiceCategory, ServiceProvider
+from directory.models import (
+    ProviderBackendChoice,
+    ProviderSettings,
+    ServiceCategory,
+    ServiceProvider,
+    cached_slugify,
+)
 from siteads.models import AdPlacement, AdUnit
 
+# Read-only so the same data can be reused across runs without being mutated.
+DEMO_PROVIDERS = (
+    MappingProxyType(
+        {
+            "category": "Plumber",
+            "name": "River City Plumbing",
+            "city": "Springfield",
+            "state": "IL",
+            "postal_code": "62701",
+            "phone": "555-0100",
+            "is_suggested": True,
+            "suggested_rank": 10,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Electrician",
+            "name": "BrightWire Electric",
+            "city": "Springfield",
+            "state": "IL",
+            "postal_code": "62701",
+            "phone": "555-0111",
+            "is_suggested": False,
+            "suggested_rank": 100,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Locksmith",
+            "name": "KeyGuard Locksmith",
+            "city": "Springfield",
+            "state": "IL",
+            "postal_code": "62701",
+            "phone": "555-0122",
+            "is_suggested": True,
+            "suggested_rank": 20,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Plumber",
+            "name": "Southeast MB Plumbing",
+            "city": "Steinbach",
+            "state": "MB",
+            "postal_code": "R0A 0A0",
+            "country": "CA",
+            "phone": "555-0200",
+            "website": "https://example.com/",
+            "is_suggested": True,
+            "suggested_rank": 15,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Electrician",
+            "name": "Southeast MB Electric",
+            "city": "Steinbach",
+            "state": "MB",
+            "postal_code": "R0A 0A0",
+            "country": "CA",
+            "phone": "555-0201",
+            "website": "https://example.com/",
+            "is_suggested": False,
+            "suggested_rank": 110,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "HVAC",
+            "name": "Prairie HVAC Co.",
+            "city": "Winnipeg",
+            "state": "MB",
+            "postal_code": "R3C 0V8",
+            "country": "CA",
+            "phone": "555-0300",
+            "website": "https://example.com/",
+            "is_suggested": True,
+            "suggested_rank": 12,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Handyman",
+            "name": "Peg City Handyman",
+            "city": "Winnipeg",
+            "state": "MB",
+            "postal_code": "R3C 0V8",
+            "country": "CA",
+            "phone": "555-0301",
+            "website": "https://example.com/",
+            "is_suggested": False,
+            "suggested_rank": 120,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Appliance Repair",
+            "name": "North End Appliance Repair",
+            "city": "Winnipeg",
+            "state": "MB",
+            "postal_code": "R2X 0M1",
+            "country": "CA",
+            "phone": "555-0310",
+            "website": "https://example.com/",
+            "is_suggested": True,
+            "suggested_rank": 18,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Roofing",
+            "name": "Red River Roofing",
+            "city": "Winnipeg",
+            "state": "MB",
+            "postal_code": "R3T 2N2",
+            "country": "CA",
+            "phone": "555-0320",
+            "website": "https://example.com/",
+            "is_suggested": False,
+            "suggested_rank": 130,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Landscaping",
+            "name": "Prairie Lawn & Snow",
+            "city": "Winnipeg",
+            "state": "MB",
+            "postal_code": "R3Y 0A1",
+            "country": "CA",
+            "phone": "555-0330",
+            "website": "https://example.com/",
+            "is_suggested": False,
+            "suggested_rank": 140,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Cleaning",
+            "name": "Downtown Cleaning Co.",
+            "city": "Winnipeg",
+            "state": "MB",
+            "postal_code": "R3B 1A1",
+            "country": "CA",
+            "phone": "555-0340",
+            "website": "https://example.com/",
+            "is_suggested": False,
+            "suggested_rank": 150,
+        }
+    ),
+    MappingProxyType(
+        {
+            "category": "Moving",
+            "name": "Manitoba Movers",
+            "city": "Winnipeg",
+            "state": "MB",
+            "postal_code": "R2C 0A1",
+            "country": "CA",
+            "phone": "555-0350",
+            "website": "https://example.com/",
+            "is_suggested": True,
+            "suggested_rank": 14,
+        }
+    ),
+)
+
+# Columns refreshed from the demo data when a demo provider already exists.
+DEMO_PROVIDER_UPDATE_FIELDS = [
+    "city",
+    "state",
+    "postal_code",
+    "country",
+    "phone",
+    "website",
+    "is_suggested",
+    "suggested_rank",
+    "updated_at",
+]
+
 
 class Command(BaseCommand):
     help = "Seed starter categories, demo providers, and ensure a test admin exists."
@@ -18,7 +209,13 @@ class Command(BaseCommand):
         parser.add_argument("--admin-username", default="admin")
         parser.add_argument("--admin-password", default="secret")
 
+    @transaction.atomic
     def handle(self, *args, **options):
+        if connection.vendor == "postgresql":
+            # Seed data is reproducible, so don't wait on WAL flush at commit.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+
         admin_username = options["admin_username"]
         admin_password = options["admin_password"]
 
@@ -27,10 +224,17 @@ class Command(BaseCommand):
             username=admin_username,
             defaults={"is_staff": True, "is_superuser": True, "email": "admin@example.com"},
         )
-        admin_user.is_staff = True
-        admin_user.is_superuser = True
-        admin_user.set_password(admin_password)
-        admin_user.save()
+        # Hashing a password is deliberately slow; skip the write on no-op re-runs.
+        update_fields = []
+        if created or not admin_user.check_password(admin_password):
+            admin_user.set_password(admin_password)
+            update_fields.append("password")
+        if not (admin_user.is_staff and admin_user.is_superuser):
+            admin_user.is_staff = True
+            admin_user.is_superuser = True
+            update_fields += ["is_staff", "is_superuser"]
+        if update_fields:
+            admin_user.save(update_fields=update_fields)
 
         UserProfile.objects.get_or_create(user=admin_user)
 
@@ -73,158 +277,8 @@ class Command(BaseCommand):
             "Moving": 110,
         }
 
-        category_objs = {}
-        for name in categories:
-            obj, _ = ServiceCategory.objects.get_or_create(name=name)
-            obj.sort_order = category_order.get(name, 100)
-            obj.is_active = True
-            obj.save()
-            category_objs[name] = obj
-
-        demo_providers = [
-            {
-                "category": "Plumber",
-                "name": "River City Plumbing",
-                "city": "Springfield",
-                "state": "IL",
-                "postal_code": "62701",
-                "phone": "555-0100",
-                "is_suggested": True,
-                "suggested_rank": 10,
-            },
-            {
-                "category": "Electrician",
-                "name": "BrightWire Electric",
-                "city": "Springfield",
-                "state": "IL",
-                "postal_code": "62701",
-                "phone": "555-0111",
-                "is_suggested": False,
-                "suggested_rank": 100,
-            },
-            {
-                "category": "Locksmith",
-                "name": "KeyGuard Locksmith",
-                "city": "Springfield",
-                "state": "IL",
-                "postal_code": "62701",
-                "phone": "555-0122",
-                "is_suggested": True,
-                "suggested_rank": 20,
-            },
-            {
-                "category": "Plumber",
-                "name": "Southeast MB Plumbing",
-                "city": "Steinbach",
-                "state": "MB",
-                "postal_code": "R0A 0A0",
-                "country": "CA",
-                "phone": "555-0200",
-                "website": "https://example.com/",
-                "is_suggested": True,
-                "suggested_rank": 15,
-            },
-            {
-                "category": "Electrician",
-                "name": "Southeast MB Electric",
-                "city": "Steinbach",
-                "state": "MB",
-                "postal_code": "R0A 0A0",
-                "country": "CA",
-                "phone": "555-0201",
-                "website": "https://example.com/",
-                "is_suggested": False,
-                "suggested_rank": 110,
-            },
-            {
-                "category": "HVAC",
-                "name": "Prairie HVAC Co.",
-                "city": "Winnipeg",
-                "state": "MB",
-                "postal_code": "R3C 0V8",
-                "country": "CA",
-                "phone": "555-0300",
-                "website": "https://example.com/",
-                "is_suggested": True,
-                "suggested_rank": 12,
-            },
-            {
-                "category": "Handyman",
-                "name": "Peg City Handyman",
-                "city": "Winnipeg",
-                "state": "MB",
-                "postal_code": "R3C 0V8",
-                "country": "CA",
-                "phone": "555-0301",
-                "website": "https://example.com/",
-                "is_suggested": False,
-                "suggested_rank": 120,
-            },
-            {
-                "category": "Appliance Repair",
-                "name": "North End Appliance Repair",
-                "city": "Winnipeg",
-                "state": "MB",
-                "postal_code": "R2X 0M1",
-                "country": "CA",
-                "phone": "555-0310",
-                "website": "https://example.com/",
-                "is_suggested": True,
-                "suggested_rank": 18,
-            },
-            {
-                "category": "Roofing",
-                "name": "Red River Roofing",
-                "city": "Winnipeg",
-                "state": "MB",
-                "postal_code": "R3T 2N2",
-                "country": "CA",
-                "phone": "555-0320",
-                "website": "https://example.com/",
-                "is_suggested": False,
-                "suggested_rank": 130,
-            },
-            {
-                "category": "Landscaping",
-                "name": "Prairie Lawn & Snow",
-                "city": "Winnipeg",
-                "state": "MB",
-                "postal_code": "R3Y 0A1",
-                "country": "CA",
-                "phone": "555-0330",
-                "website": "https://example.com/",
-                "is_suggested": False,
-                "suggested_rank": 140,
-            },
-            {
-                "category": "Cleaning",
-                "name": "Downtown Cleaning Co.",
-                "city": "Winnipeg",
-                "state": "MB",
-                "postal_code": "R3B 1A1",
-                "country": "CA",
-                "phone": "555-0340",
-                "website": "https://example.com/",
-                "is_suggested": False,
-                "suggested_rank": 150,
-            },
-            {
-                "category": "Moving",
-                "name": "Manitoba Movers",
-                "city": "Winnipeg",
-                "state": "MB",
-                "postal_code": "R2C 0A1",
-                "country": "CA",
-                "phone": "555-0350",
-                "website": "https://example.com/",
-                "is_suggested": True,
-                "suggested_rank": 14,
-            },
-        ]
-
-        for item in demo_providers:
-            category = category_objs[item.pop("category")]
-            ServiceProvider.objects.get_or_create(category=category, name=item["name"], defaults=item)
+        category_objs = self._seed_categories(categories, category_order)
+        self._seed_providers(category_objs, DEMO_PROVIDERS)
 
         AdUnit.objects.get_or_create(
             placement=AdPlacement.HOME_INLINE_1,
@@ -248,3 +302,49 @@ class Command(BaseCommand):
         )
 
         self.stdout.write(self.style.SUCCESS("Seed complete."))
+
+    def _seed_categories(self, categories, category_order):
+        existing = ServiceCategory.objects.in_bulk(categories, field_name="name")
+        # Only write rows that actually drifted, so re-runs are read-only.
+        stale = []
+        for obj in existing.values():
+            sort_order = category_order.get(obj.name, 100)
+            if obj.sort_order != sort_order or not obj.is_active:
+                obj.sort_order = sort_order
+                obj.is_active = True
+                stale.append(obj)
+        if stale:
+            ServiceCategory.objects.bulk_update(stale, ["sort_order", "is_active"])
+
+        # bulk_create skips save(), so fill in the slug here.
+        missing = [
+            ServiceCategory(name=name, slug=cached_slugify(name), sort_order=category_order.get(name, 100), is_active=True)
+            for name in categories
+            if name not in existing
+        ]
+        if missing:
+            ServiceCategory.objects.bulk_create(missing, batch_size=500, ignore_conflicts=True)
+            # Re-read so every object has a primary key (not all backends return them).
+            existing = ServiceCategory.objects.in_bulk(categories, field_name="name")
+        # Bulk writes skip the signals that keep the dropdown cache fresh.
+        ServiceCategory.invalidate_choices()
+        return existing
+
+    def _seed_providers(self, category_objs, demo_providers):
+        # One INSERT ... ON CONFLICT (category, name) DO UPDATE for all demo rows.
+        # bulk_create skips save(), so stamp updated_at once for the whole batch.
+        now = timezone.now()
+        ServiceProvider.objects.bulk_create(
+            [
+                ServiceProvider(
+                    category=category_objs[item["category"]],
+                    updated_at=now,
+                    **{k: v for k, v in item.items() if k != "category"},
+                )
+                for item in demo_providers
+            ],
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["category", "name"],
+            update_fields=DEMO_PROVIDER_UPDATE_FIELDS,
+        )
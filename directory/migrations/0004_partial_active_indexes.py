@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0003_provider_settings'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='serviceprovider',
+            name='directory_s_categor_cf2d04_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='serviceprovider',
+            name='directory_s_categor_e8763f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='servicecategory',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['sort_order', 'name'], name='sc_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceprovider',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'postal_code'], name='sp_cat_postal_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceprovider',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'city', 'state'], name='sp_cat_city_active_idx'),
+        ),
+    ]
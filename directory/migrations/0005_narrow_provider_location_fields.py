@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0005_shorten_provider_location_values'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='serviceprovider',
+            name='city',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='serviceprovider',
+            name='country',
+            field=models.CharField(blank=True, default='CA', help_text='2-letter country code (e.g., CA, US).', max_length=2),
+        ),
+        migrations.AlterField(
+            model_name='serviceprovider',
+            name='state',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Data step for 0005_narrow_provider_location_fields, kept in its own
+# migration: on PostgreSQL, updating rows and then altering the same table in
+# one transaction can fail with "pending trigger events".
+
+from django.db import migrations
+
+COUNTRY_CODES = {
+    'CANADA': 'CA',
+    'UNITED STATES': 'US',
+    'UNITED STATES OF AMERICA': 'US',
+    'USA': 'US',
+}
+
+
+def shorten_location_fields(apps, schema_editor):
+    """Fit existing rows into the narrower columns before altering them."""
+    ServiceProvider = apps.get_model('directory', 'ServiceProvider')
+    changed = []
+    unknown = []
+    for provider in ServiceProvider.objects.only('city', 'state', 'country').iterator():
+        country = (provider.country or '').strip().upper()
+        if len(country) > 2:
+            if country not in COUNTRY_CODES:
+                # Don't guess from the first two letters ("MEXICO" is not "ME").
+                unknown.append(f'{provider.pk}: {provider.country!r}')
+                continue
+            country = COUNTRY_CODES[country]
+        city, state = provider.city[:64], provider.state[:64]
+        if (city, state, country) != (provider.city, provider.state, provider.country):
+            provider.city, provider.state, provider.country = city, state, country
+            changed.append(provider)
+    if unknown:
+        raise ValueError(
+            'Set a 2-letter country code on these providers before migrating: ' + ', '.join(unknown)
+        )
+    ServiceProvider.objects.bulk_update(changed, ['city', 'state', 'country'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0004_partial_active_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(shorten_location_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Trigram index for provider name search (PostgreSQL only).
+#
+# The search views filter with name__icontains, which PostgreSQL renders as
+# UPPER("name"::text) LIKE UPPER('%term%'). A leading wildcard can't use a
+# btree, but a pg_trgm GIN index on that same expression can. Other backends
+# keep scanning; their tables are small.
+
+from django.db import migrations
+
+INDEX_NAME = 'sp_name_trgm_idx'
+TABLE = 'directory_serviceprovider'
+
+
+def create_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON {TABLE} '
+        'USING GIN ((UPPER(name::text)) gin_trgm_ops)'
+    )
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('directory', '0005_narrow_provider_location_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+    ]
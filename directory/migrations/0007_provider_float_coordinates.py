@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0006_provider_name_trgm'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='serviceprovider',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='serviceprovider',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0007_provider_float_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='serviceprovider',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_suggested', True)), fields=['suggested_rank', 'name'], name='sp_suggested_order_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:48
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_no_duplicates(apps, schema_editor):
+    """Fail with a readable message instead of a bare IntegrityError."""
+    ServiceProvider = apps.get_model('directory', 'ServiceProvider')
+    dupes = list(
+        ServiceProvider.objects.values('category_id', 'name')
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+        .order_by()[:10]
+    )
+    if dupes:
+        listed = ', '.join(f"{d['name']!r} (category {d['category_id']})" for d in dupes)
+        raise RuntimeError(f'Merge or rename duplicate providers before migrating: {listed}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0008_suggested_order_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_no_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='serviceprovider',
+            constraint=models.UniqueConstraint(fields=('category', 'name'), name='uniq_provider_cat_name'),
+        ),
+    ]
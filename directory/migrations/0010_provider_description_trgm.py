@@ -0,0 +1,39 @@
+# Trigram index for provider description search (PostgreSQL only).
+#
+# Same idea as 0006: the views match description__icontains, so index the
+# exact UPPER(description::text) expression PostgreSQL compiles that to.
+
+from django.db import migrations
+
+INDEX_NAME = 'sp_description_trgm_idx'
+TABLE = 'directory_serviceprovider'
+
+
+def create_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON {TABLE} '
+        'USING GIN ((UPPER(description::text)) gin_trgm_ops)'
+    )
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('directory', '0009_provider_unique_category_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+    ]
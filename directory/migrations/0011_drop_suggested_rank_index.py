@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0010_provider_description_trgm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='serviceprovider',
+            name='directory_s_is_sugg_f8b970_idx',
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Trigram index for category name search (PostgreSQL only).
+#
+# Completes 0006/0010: the text search also matches category__name__icontains,
+# which compiles to UPPER(name::text) LIKE ... on the joined category table.
+
+from django.db import migrations
+
+INDEX_NAME = 'sc_name_trgm_idx'
+TABLE = 'directory_servicecategory'
+
+
+def create_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON {TABLE} '
+        'USING GIN ((UPPER(name::text)) gin_trgm_ops)'
+    )
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('directory', '0012_provider_manual_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:07
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0013_category_name_trgm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='serviceprovider',
+            name='sp_cat_postal_active_idx',
+        ),
+        migrations.AddField(
+            model_name='serviceprovider',
+            name='postal_code_norm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Upper(django.db.models.functions.text.Replace('postal_code', models.Value(' '), models.Value(''))), output_field=models.CharField(max_length=20)),
+        ),
+        migrations.AddIndex(
+            model_name='serviceprovider',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'postal_code_norm'], name='sp_cat_pcnorm_active_idx'),
+        ),
+    ]
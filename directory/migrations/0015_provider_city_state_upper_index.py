@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:07
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('directory', '0014_provider_postal_code_norm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='serviceprovider',
+            name='sp_cat_city_active_idx',
+        ),
+        migrations.AddIndex(
+            model_name='serviceprovider',
+            index=models.Index(models.F('category'), django.db.models.functions.text.Upper('city'), django.db.models.functions.text.Upper('state'), condition=models.Q(('is_active', True)), name='sp_cat_city_upper_active_idx'),
+        ),
+    ]
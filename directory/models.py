@@ -2,9 +2,45 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Q, Value, signals
+from django.db.models.functions import Replace, Upper
+from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.text import slugify
 
+CATEGORY_CHOICES_CACHE_KEY = "directory:category_choices:v1"
+CATEGORY_CHOICES_CACHE_TIMEOUT = 60 * 60
+ACTIVE_CATEGORIES_CACHE_KEY = "directory:active_categories:v1"
+PROVIDER_SETTINGS_CACHE_KEY = "directory:provider_settings:v1"
+PROVIDER_SETTINGS_CACHE_TIMEOUT = 60 * 60
+# Save/delete signals only clear the cache of the process that handled the change.
+# Without a shared default cache (e.g. LocMem per gunicorn worker), other workers
+# would keep a stale copy for the full timeout, so cap it at this instead.
+UNSHARED_CACHE_TIMEOUT = 30
+_UNSHARED_CACHE_BACKENDS = (
+	"django.core.cache.backends.locmem.LocMemCache",
+	"django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def _signal_invalidated_timeout(timeout: int) -> int:
+	"""Timeout for entries that rely on signal invalidation to stay fresh."""
+	backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+	if backend in _UNSHARED_CACHE_BACKENDS:
+		return min(timeout, UNSHARED_CACHE_TIMEOUT)
+	return timeout
+
+
+@lru_cache(maxsize=512)
+def cached_slugify(name: str) -> str:
+	"""slugify() for category names, which come from a small, stable set."""
+	return slugify(name)
+
 
 class ServiceCategory(models.Model):
 	"""A type of service users search for (plumber, mechanic, etc.)."""
@@ -19,15 +55,48 @@ class ServiceCategory(models.Model):
 
 	class Meta:
 		ordering = ["sort_order", "name"]
+		indexes = [
+			# The search form lists active categories in this order on every page.
+			models.Index(fields=["sort_order", "name"], name="sc_active_order_idx", condition=Q(is_active=True)),
+		]
 
 	def save(self, *args, **kwargs):
 		if not self.slug:
-			self.slug = slugify(self.name)
+			self.slug = cached_slugify(self.name)
 		super().save(*args, **kwargs)
 
 	def __str__(self) -> str:
 		return self.name
 
+	@classmethod
+	def active_choices(cls) -> list[tuple[int, str]]:
+		"""(id, name) for active categories, cached until a category changes."""
+		return cache.get_or_set(
+			CATEGORY_CHOICES_CACHE_KEY,
+			lambda: list(cls.objects.filter(is_active=True).values_list("id", "name")),
+			_signal_invalidated_timeout(CATEGORY_CHOICES_CACHE_TIMEOUT),
+		)
+
+	@classmethod
+	def active_categories(cls) -> list["ServiceCategory"]:
+		"""Active categories (id, name and slug loaded), cached until a category changes."""
+		return cache.get_or_set(
+			ACTIVE_CATEGORIES_CACHE_KEY,
+			lambda: list(cls.objects.filter(is_active=True).only("id", "name", "slug")),
+			_signal_invalidated_timeout(CATEGORY_CHOICES_CACHE_TIMEOUT),
+		)
+
+	@classmethod
+	def invalidate_choices(cls) -> None:
+		"""Drop the cached choices/categories; call after bulk updates that skip signals."""
+		cache.delete_many([CATEGORY_CHOICES_CACHE_KEY, ACTIVE_CATEGORIES_CACHE_KEY])
+
+
+@receiver(signals.post_save, sender=ServiceCategory)
+@receiver(signals.post_delete, sender=ServiceCategory)
+def invalidate_category_choices(sender, **kwargs):
+	ServiceCategory.invalidate_choices()
+
 
 class ServiceProvider(models.Model):
 	"""A local business/provider that offers a service category."""
@@ -43,13 +112,19 @@ class ServiceProvider(models.Model):
 
 	address_line1 = models.CharField(max_length=120, blank=True)
 	address_line2 = models.CharField(max_length=120, blank=True)
-	city = models.CharField(max_length=80, blank=True)
-	state = models.CharField(max_length=80, blank=True)
+	city = models.CharField(max_length=64, blank=True)
+	state = models.CharField(max_length=64, blank=True)
 	postal_code = models.CharField(max_length=20, blank=True)
-	country = models.CharField(max_length=80, blank=True, default="CA")
+	# Stored "R5G1J8" form of postal_code, so the search can match it through an index.
+	postal_code_norm = models.GeneratedField(
+		expression=Upper(Replace("postal_code", Value(" "), Value(""))),
+		output_field=models.CharField(max_length=20),
+		db_persist=True,
+	)
+	country = models.CharField(max_length=2, blank=True, default="CA", help_text="2-letter country code (e.g., CA, US).")
 
-	latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
-	longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+	latitude = models.FloatField(null=True, blank=True)
+	longitude = models.FloatField(null=True, blank=True)
 
 	is_suggested = models.BooleanField(
 		default=False,
@@ -62,19 +137,42 @@ class ServiceProvider(models.Model):
 	is_active = models.BooleanField(default=True)
 
 	created_at = models.DateTimeField(auto_now_add=True)
-	updated_at = models.DateTimeField(auto_now=True)
+	# Stamped in save() rather than auto_now, so bulk writes choose whether to touch it.
+	updated_at = models.DateTimeField(default=timezone.now, editable=False)
 
 	class Meta:
 		ordering = ["-is_suggested", "suggested_rank", "name"]
 		indexes = [
-			models.Index(fields=["category", "postal_code", "is_active"]),
-			models.Index(fields=["category", "city", "state", "is_active"]),
-			models.Index(fields=["is_suggested", "suggested_rank"]),
+			# Every public lookup filters is_active=True, so only index active rows.
+			models.Index(fields=["category", "postal_code_norm"], name="sp_cat_pcnorm_active_idx", condition=Q(is_active=True)),
+			# The search matches city/state with iexact, i.e. UPPER(col) = UPPER(%s) on PostgreSQL.
+			models.Index(
+				"category",
+				Upper("city"),
+				Upper("state"),
+				name="sp_cat_city_upper_active_idx",
+				condition=Q(is_active=True),
+			),
+			# Matches the "Suggested" listing: active + suggested, ordered by rank then name.
+			models.Index(
+				fields=["suggested_rank", "name"],
+				name="sp_suggested_order_idx",
+				condition=Q(is_active=True, is_suggested=True),
+			),
+		]
+		constraints = [
+			models.UniqueConstraint(fields=["category", "name"], name="uniq_provider_cat_name"),
 		]
 
 	def __str__(self) -> str:
 		return self.name
 
+	def save(self, *args, **kwargs):
+		update_fields = kwargs.get("update_fields")
+		if update_fields is None or "updated_at" in update_fields:
+			self.updated_at = timezone.now()
+		super().save(*args, **kwargs)
+
 
 class ProviderBackendChoice(models.TextChoices):
 	OSM = "OSM", "OpenStreetMap"
@@ -115,5 +213,18 @@ class ProviderSettings(models.Model):
 
 	@classmethod
 	def get_solo(cls) -> "ProviderSettings":
-		obj, _ = cls.objects.get_or_create(pk=1)
+		"""Return the settings row, cached until it is saved or deleted."""
+		obj = cache.get(PROVIDER_SETTINGS_CACHE_KEY)
+		if obj is None:
+			# Plain read first; get_or_create only for the very first call.
+			obj = cls.objects.filter(pk=1).first()
+			if obj is None:
+				obj, _ = cls.objects.get_or_create(pk=1)
+			cache.set(PROVIDER_SETTINGS_CACHE_KEY, obj, _signal_invalidated_timeout(PROVIDER_SETTINGS_CACHE_TIMEOUT))
 		return obj
+
+
+@receiver(signals.post_save, sender=ProviderSettings)
+@receiver(signals.post_delete, sender=ProviderSettings)
+def invalidate_provider_settings(sender, **kwargs):
+	cache.delete(PROVIDER_SETTINGS_CACHE_KEY)
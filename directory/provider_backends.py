@@ -2,21 +2,361 @@ from __future__ import annotations
 
 import json
 import hashlib
+import re
 import time
 import urllib.parse
-import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Optional
 
-import urllib.error
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import cache, caches
+from django.db import connections
 
 from directory.models import ProviderBackendChoice, ProviderSettings, ServiceCategory
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# One pooled session per process: repeat calls to Nominatim/Overpass/Google
+# reuse the TCP+TLS connection instead of handshaking every time.
+# Busy/unavailable responses and connection errors are retried once. Retry-After
+# is ignored: urllib3 would sleep for whatever the server asks, outside the
+# _read_json deadline, and stall the request thread.
+_RETRY = Retry(
+    total=1,
+    backoff_factor=0.6,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=None,
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+
+# OSM settings come from the environment and don't change at runtime; read them once.
+_OSM_NOMINATIM_URL = getattr(settings, "OSM_NOMINATIM_URL", "https://nominatim.openstreetmap.org/search")
+_OSM_OVERPASS_URL = getattr(settings, "OSM_OVERPASS_URL", "https://overpass-api.de/api/interpreter")
+_OSM_USER_AGENT = getattr(settings, "OSM_USER_AGENT", "local-services-local-dev")
+_OSM_CONTACT_EMAIL = getattr(settings, "OSM_CONTACT_EMAIL", "")
+_OSM_DEFAULT_RADIUS_KM = getattr(settings, "OSM_DEFAULT_RADIUS_KM", None)
+_OSM_MAX_RESPONSE_BYTES = getattr(settings, "OSM_MAX_RESPONSE_BYTES", 4_000_000)
+_JSON_HEADERS = {"Accept": "application/json"}
+_OSM_HEADERS = {
+    "User-Agent": _OSM_USER_AGENT,
+    "Accept": "application/json",
+}
+
+# A host that doesn't accept the connection quickly is down; don't wait the full read timeout.
+_CONNECT_TIMEOUT = 5
+
+# Background pool for speculative lookups that overlap with the main request.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="provider-http")
+# Whole searches run on their own pool: they wait on _EXECUTOR jobs, so sharing
+# one pool could deadlock.
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="provider-search")
+
+# Lookup tables, built once at import instead of on every call.
+
+# nwr = node, way and relation in one statement.
+_OVERPASS_GROUP_TMPL = "nwr(around:{r},{la},{lo}){t};"
+# Shorter name filters match almost everything and just make Overpass work harder.
+_OVERPASS_NAME_FILTER_MIN_LEN = 3
+_OVERPASS_REGEX_SPECIAL = frozenset(".^$*+?()[]{}|")
+_CA_POSTAL_RE = re.compile(r"^([ABCEGHJ-NPRSTVXY]\d[A-Z])\s?(\d[A-Z]\d)$", re.IGNORECASE)
+_CA_POSTAL_FIRST_TO_PROVINCE = MappingProxyType(
+    {
+        "A": "Newfoundland and Labrador",
+        "B": "Nova Scotia",
+        "C": "Prince Edward Island",
+        "E": "New Brunswick",
+        "G": "Quebec",
+        "H": "Quebec",
+        "J": "Quebec",
+        "K": "Ontario",
+        "L": "Ontario",
+        "M": "Ontario",
+        "N": "Ontario",
+        "P": "Ontario",
+        "R": "Manitoba",
+        "S": "Saskatchewan",
+        "T": "Alberta",
+        "V": "British Columbia",
+        "X": "Northwest Territories",
+        "Y": "Yukon",
+    }
+)
+_CA_PROVINCE_TO_ABBREV = MappingProxyType(
+    {
+        "Newfoundland and Labrador": "NL",
+        "Nova Scotia": "NS",
+        "Prince Edward Island": "PE",
+        "New Brunswick": "NB",
+        "Quebec": "QC",
+        "Ontario": "ON",
+        "Manitoba": "MB",
+        "Saskatchewan": "SK",
+        "Alberta": "AB",
+        "British Columbia": "BC",
+        "Northwest Territories": "NT",
+        "Nunavut": "NU",
+        "Yukon": "YT",
+    }
+)
+_CA_ABBREV_TO_FULL = MappingProxyType({ab: full for full, ab in _CA_PROVINCE_TO_ABBREV.items()})
+# Lower-cased full names and abbreviations -> abbreviation.
+_CA_STATE_NORMALIZE = MappingProxyType(
+    {
+        **{full.lower(): ab for full, ab in _CA_PROVINCE_TO_ABBREV.items()},
+        **{ab.lower(): ab for ab in _CA_PROVINCE_TO_ABBREV.values()},
+    }
+)
+# OSM tag groups per category; each group is AND-ed tags, groups are OR-ed.
+_TagGroups = tuple[tuple[tuple[str, str], ...], ...]
+_OSM_PLUMBER: _TagGroups = ((("craft", "plumber"),),)
+_OSM_ELECTRICIAN: _TagGroups = ((("craft", "electrician"),),)
+_OSM_LOCKSMITH: _TagGroups = ((("craft", "locksmith"),),)
+# Mechanics/auto shops are tagged in multiple ways; use OR groups.
+_OSM_MECHANIC: _TagGroups = (
+    (("shop", "car_repair"),),
+    (("amenity", "car_repair"),),
+    (("craft", "car_repair"),),
+    (("service", "vehicle_repair"),),
+)
+_OSM_HVAC: _TagGroups = ((("craft", "hvac"),),)
+_OSM_APPLIANCE_REPAIR: _TagGroups = ((("craft", "appliance_repair"),),)
+_OSM_CATEGORY_MAP = MappingProxyType(
+    {
+        "plumber": _OSM_PLUMBER,
+        "electrician": _OSM_ELECTRICIAN,
+        "locksmith": _OSM_LOCKSMITH,
+        "mechanic": _OSM_MECHANIC,
+        "hvac": _OSM_HVAC,
+        "handyman": ((("craft", "handyman"),),),
+        "appliance-repair": _OSM_APPLIANCE_REPAIR,
+        "appliance-repair-1": _OSM_APPLIANCE_REPAIR,
+        "appliance-repair-2": _OSM_APPLIANCE_REPAIR,
+    }
+)
+# Substring heuristics for slugs/names that aren't exact keys. When several
+# keywords appear, the earliest one in _CATEGORY_KEYWORDS wins.
+_CATEGORY_KEYWORDS = ("plumb", "electric", "lock", "mechan", "auto", "hvac")
+_CATEGORY_KEYWORD_RE = re.compile("|".join(_CATEGORY_KEYWORDS))
+_OSM_KEYWORD_GROUPS = MappingProxyType(
+    {
+        "plumb": _OSM_PLUMBER,
+        "electric": _OSM_ELECTRICIAN,
+        "lock": _OSM_LOCKSMITH,
+        "mechan": _OSM_MECHANIC,
+        "auto": _OSM_MECHANIC,
+        "hvac": _OSM_HVAC,
+    }
+)
+
+
+def _category_keyword(key: str) -> str:
+    """The highest-priority heuristic keyword contained in `key`, or ""."""
+    found = _CATEGORY_KEYWORD_RE.findall(key)
+    if not found:
+        return ""
+    return min(found, key=_CATEGORY_KEYWORDS.index)
+
+
+_COUNTRY_DISPLAY_NAMES = MappingProxyType({"CA": "Canada", "US": "United States"})
+_GOOGLE_BLOCKED_TYPES = frozenset(
+    {
+        "locality",
+        "postal_code",
+        "route",
+        "political",
+        "administrative_area_level_1",
+        "administrative_area_level_2",
+        "country",
+        "point_of_interest",
+    }
+)
+_GOOGLE_KEYWORD_TYPES = MappingProxyType(
+    {
+        "plumb": frozenset({"plumber"}),
+        "electric": frozenset({"electrician"}),
+        "lock": frozenset({"locksmith"}),
+        "mechan": frozenset({"car_repair"}),
+        "auto": frozenset({"car_repair"}),
+    }
+)
+_GOOGLE_EXPECTED_TYPES = MappingProxyType(
+    {
+        "plumber": frozenset({"plumber"}),
+        "electrician": frozenset({"electrician"}),
+        "locksmith": frozenset({"locksmith"}),
+        "mechanic": frozenset({"car_repair"}),
+    }
+)
+
+
+@lru_cache(maxsize=128)
+def _overpass_tag_filter(group: tuple[tuple[str, str], ...]) -> str:
+    # Tag groups come from the fixed module tables, so each filter is built once.
+    return "".join(f"[\"{k}\"=\"{v}\"]" for k, v in group)
+
+
+def _overpass_name_filter(query_text: str) -> str:
+    r"""Case-insensitive name-contains filter for an Overpass statement.
+
+    Regex metacharacters get a regex escape (\x) that is itself escaped for the
+    QL string literal (\\x); quotes and backslashes are escaped accordingly.
+    """
+    # Overpass' ",i" folding isn't reliable outside ASCII; leave those to the Python check.
+    if len(query_text) < _OVERPASS_NAME_FILTER_MIN_LEN or not (query_text.isascii() and query_text.isprintable()):
+        return ""
+    parts = []
+    for ch in query_text:
+        if ch == "\\":
+            parts.append("\\\\\\\\")
+        elif ch in _OVERPASS_REGEX_SPECIAL:
+            parts.append("\\\\" + ch)
+        elif ch == '"':
+            parts.append('\\"')
+        else:
+            parts.append(ch)
+    return f'["name"~"{"".join(parts)}",i]'
+
+
+def _to_float(value: object) -> Optional[float]:
+    # orjson/json already give floats for Overpass/Google; Nominatim sends strings.
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _coords(lat: object, lon: object) -> tuple[Optional[float], Optional[float]]:
+    """Both coordinates as floats, or (None, None) if either is missing/invalid."""
+    lat_f = _to_float(lat)
+    lon_f = _to_float(lon)
+    if lat_f is None or lon_f is None:
+        return None, None
+    return lat_f, lon_f
+
+
+def _first(tags: dict, keys: tuple[str, ...]) -> str:
+    """First non-empty value among keys (e.g. a tag and its contact:* alias)."""
+    for key in keys:
+        value = tags.get(key)
+        if value:
+            return value
+    return ""
+
+
+def _read_json(resp: requests.Response, *, deadline: float) -> object:
+    """Decode a streamed response, bailing out early if it's unreasonably large or slow."""
+    max_bytes = _OSM_MAX_RESPONSE_BYTES
+    length = resp.headers.get("Content-Length") or ""
+    if length.isdigit() and int(length) > max_bytes:
+        raise ProviderBackendError("External response too large")
+    # Content-Length can be missing (chunked), so also cap what we actually read.
+    body = bytearray()
+    for chunk in resp.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) > max_bytes:
+            raise ProviderBackendError("External response too large")
+        # The read timeout is per socket read, so a slow trickle needs a total cap.
+        if time.monotonic() > deadline:
+            raise ProviderBackendError("External response timed out")
+    return _loads(bytes(body))
+
+
+# Listings go stale, so results are short-lived; a definite "nothing here" for a
+# rare category/locality is kept longer to spare the external APIs.
+_RESULTS_CACHE_TIMEOUT = 60 * 10
+_EMPTY_RESULTS_CACHE_TIMEOUT = 60 * 60 * 2
+
+# Only configured alongside a shared (Redis) default cache; see settings.CACHES.
+_HAS_LOCAL_CACHE = "local" in settings.CACHES
+
+
+def _cache_get(key: str) -> object:
+    """Read through the per-process tier (if configured) to the shared cache."""
+    if _HAS_LOCAL_CACHE:
+        local = caches["local"]
+        value = local.get(key)
+        if value is not None:
+            return value
+        value = cache.get(key)
+        if value is not None:
+            local.set(key, value)
+        return value
+    return cache.get(key)
+
+
+def _cache_set(key: str, value: object, *, timeout: int) -> None:
+    cache.set(key, value, timeout=timeout)
+    if _HAS_LOCAL_CACHE:
+        # The local tier keeps its own, shorter TIMEOUT.
+        caches["local"].set(key, value)
+
+
+def _request_json(
+    method: str,
+    url: str,
+    *,
+    params: Optional[dict[str, str]] = None,
+    data: Optional[dict[str, str]] = None,
+    headers: dict[str, str],
+    timeout: int,
+) -> object:
+    """Shared HTTP path for every backend: pooled session, retries, size and time guards.
+
+    Connecting gets a short timeout of its own; `timeout` bounds each read and the
+    whole call.
+    """
+    deadline = time.monotonic() + timeout
+    connect_timeout = min(_CONNECT_TIMEOUT, timeout)
+    with _SESSION.request(
+        method, url, params=params, data=data, headers=headers, timeout=(connect_timeout, timeout), stream=True
+    ) as resp:
+        resp.raise_for_status()
+        return _read_json(resp, deadline=deadline)
+
+
+def _cache_key(*, prefix: str, payload: dict) -> str:
+    """Fixed-length cache key; safe for backends (e.g., memcached) that reject
+    spaces/long keys, whatever user input ends up in the payload."""
+    return _hashed_cache_key(prefix, tuple(sorted(payload.items())))
+
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=1024)
+def _hashed_cache_key(prefix: str, items: tuple) -> str:
+    # Memoized: the same category/location combinations recur across requests.
+    raw = json.dumps(dict(items), sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+    return f"{prefix}:{digest}"
+
+
+@dataclass(frozen=True, slots=True)
 class ProviderResult:
     name: str
     category: str
@@ -52,11 +392,24 @@ class ProviderBackend:
     ) -> list[ProviderResult]:
         raise NotImplementedError
 
+    def search_async(self, **kwargs) -> Future[list[ProviderResult]]:
+        """Start search() in the background so views can run local queries meanwhile."""
+        return _SEARCH_EXECUTOR.submit(self._search_in_thread, **kwargs)
+
+    def _search_in_thread(self, **kwargs) -> list[ProviderResult]:
+        try:
+            return self.search(**kwargs)
+        finally:
+            # Don't leak a DB connection if a backend ever touched the ORM here.
+            connections.close_all()
+
 
 def get_provider_backend() -> ProviderBackend:
     backend = ""
+    provider_settings = None
     try:
-        backend = (ProviderSettings.get_solo().provider_backend or "").upper()
+        provider_settings = ProviderSettings.get_solo()
+        backend = (provider_settings.provider_backend or "").upper()
     except Exception:
         backend = ""
 
@@ -66,10 +419,62 @@ def get_provider_backend() -> ProviderBackend:
     if backend == "OSM":
         return OSMBackend()
     if backend == "GOOGLE":
-        return GooglePlacesBackend()
+        return GooglePlacesBackend(provider_settings=provider_settings)
     raise ProviderBackendError(f"Unknown PROVIDER_BACKEND={backend!r}")
 
 
+# Reverse geocodes are cached per ~110 m cell (3 decimals), so repeat searches
+# from the same neighbourhood stay off Nominatim (1 req/sec usage policy).
+_REVERSE_GEOCODE_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+_REVERSE_GEOCODE_EMPTY_CACHE_TIMEOUT = 60 * 60
+
+
+def _nominatim_reverse_url() -> str:
+    """Nominatim reverse endpoint on the same host as OSM_NOMINATIM_URL."""
+    try:
+        parts = urllib.parse.urlsplit(str(_OSM_NOMINATIM_URL))
+        return urllib.parse.urlunsplit((parts.scheme, parts.netloc, "/reverse", "", ""))
+    except Exception:
+        return "https://nominatim.openstreetmap.org/reverse"
+
+
+def reverse_geocode(*, lat: float, lon: float) -> tuple[str, str, str]:
+    """Best-effort reverse geocode lat/lon -> (city, state, postal_code).
+
+    Returns empty strings when the point has no address; request errors propagate.
+    """
+    lat = float(lat)
+    lon = float(lon)
+    cache_key = f"osm:rev:v1:{round(lat, 3):.3f}:{round(lon, 3):.3f}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    params = {
+        "format": "jsonv2",
+        "lat": str(round(lat, 5)),
+        "lon": str(round(lon, 5)),
+        "addressdetails": "1",
+    }
+    payload = _request_json("GET", _nominatim_reverse_url(), params=params, headers=_OSM_HEADERS, timeout=4)
+
+    addr = (payload.get("address") if isinstance(payload, dict) else None) or {}
+    city = (
+        addr.get("city")
+        or addr.get("town")
+        or addr.get("village")
+        or addr.get("hamlet")
+        or addr.get("suburb")
+        or ""
+    )
+    state = addr.get("state") or addr.get("province") or addr.get("region") or ""
+    postal = addr.get("postcode") or ""
+    result = (str(city).strip(), str(state).strip(), str(postal).strip())
+    timeout = _REVERSE_GEOCODE_CACHE_TIMEOUT if any(result) else _REVERSE_GEOCODE_EMPTY_CACHE_TIMEOUT
+    _cache_set(cache_key, result, timeout=timeout)
+    return result
+
+
 class OSMBackend(ProviderBackend):
     source_label = "OpenStreetMap"
     """Free-ish OpenStreetMap backend.
@@ -83,69 +488,18 @@ class OSMBackend(ProviderBackend):
     """
 
     DEFAULT_RADIUS_KM = 15
-
-    def _cache_key(self, *, prefix: str, payload: dict) -> str:
-        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
-        return f"{prefix}:{digest}"
+    # search() only looks at this many elements, so don't ask Overpass for more.
+    MAX_ELEMENTS = 50
+    GEOCODE_CACHE_TIMEOUT = 60 * 60 * 24 * 30
 
     def _headers(self) -> dict[str, str]:
-        user_agent = getattr(settings, "OSM_USER_AGENT", "local-services-local-dev")
-        return {
-            "User-Agent": user_agent,
-            "Accept": "application/json",
-        }
-
-    def _http_get_json(self, url: str, *, timeout: int = 20) -> object:
-        req = urllib.request.Request(url, headers=self._headers(), method="GET")
-        last_err: Exception | None = None
-        for attempt in range(2):
-            try:
-                with urllib.request.urlopen(req, timeout=timeout) as resp:
-                    raw = resp.read().decode("utf-8")
-                return json.loads(raw)
-            except urllib.error.HTTPError as e:
-                last_err = e
-                if e.code in (429, 502, 503, 504) and attempt == 0:
-                    time.sleep(0.6)
-                    continue
-                raise
-            except urllib.error.URLError as e:
-                last_err = e
-                if attempt == 0:
-                    time.sleep(0.6)
-                    continue
-                raise
+        return _OSM_HEADERS
 
-        if last_err:
-            raise last_err
-        raise ProviderBackendError("External provider request failed.")
+    def _http_get_json(self, url: str, *, params: Optional[dict[str, str]] = None, timeout: int = 20) -> object:
+        return _request_json("GET", url, params=params, headers=self._headers(), timeout=timeout)
 
     def _http_post_form_json(self, url: str, form: dict[str, str], *, timeout: int = 30) -> object:
-        data = urllib.parse.urlencode(form).encode("utf-8")
-        req = urllib.request.Request(url, data=data, headers=self._headers(), method="POST")
-        last_err: Exception | None = None
-        for attempt in range(2):
-            try:
-                with urllib.request.urlopen(req, timeout=timeout) as resp:
-                    raw = resp.read().decode("utf-8")
-                return json.loads(raw)
-            except urllib.error.HTTPError as e:
-                last_err = e
-                if e.code in (429, 502, 503, 504) and attempt == 0:
-                    time.sleep(0.8)
-                    continue
-                raise
-            except urllib.error.URLError as e:
-                last_err = e
-                if attempt == 0:
-                    time.sleep(0.8)
-                    continue
-                raise
-
-        if last_err:
-            raise last_err
-        raise ProviderBackendError("External provider request failed.")
+        return _request_json("POST", url, data=form, headers=self._headers(), timeout=timeout)
 
     def _geocode_postal_via_overpass(self, *, postal_code: str, country: str) -> tuple[Optional[float], Optional[float], str]:
         """Fallback geocode using Overpass when Nominatim can't resolve a postal code.
@@ -159,28 +513,20 @@ class OSMBackend(ProviderBackend):
             return None, None, ""
 
         pc = self._normalize_postal_code(postal_code, country=country)
-        if not pc:
-            return None, None, ""
-
-        raw = pc.replace(" ", "")
-        if len(raw) != 6:
+        if not _CA_POSTAL_RE.match(pc):
             return None, None, ""
-        # Match both "A1A 1A1" and "A1A1A1".
-        regex = f"^{raw[:3]} ?{raw[3:]}$"
 
-        overpass_url = getattr(settings, "OSM_OVERPASS_URL", "https://overpass-api.de/api/interpreter")
+        # Exact matches on both "A1A 1A1" and "A1A1A1" are cheaper for Overpass
+        # than a regex (~) tag filter.
+        statements = "".join(f"nwr(area.ca)[\"addr:postcode\"=\"{form}\"];" for form in (pc, pc.replace(" ", "")))
         query = (
             "[out:json][timeout:25];"
             "area[\"ISO3166-1\"=\"CA\"][admin_level=2]->.ca;"
-            "("
-            f"node(area.ca)[\"addr:postcode\"~\"{regex}\"];"
-            f"way(area.ca)[\"addr:postcode\"~\"{regex}\"];"
-            f"relation(area.ca)[\"addr:postcode\"~\"{regex}\"];"
-            ");"
+            f"({statements});"
             "out center 1;"
         )
 
-        payload = self._http_post_form_json(overpass_url, {"data": query})
+        payload = self._http_post_form_json(_OSM_OVERPASS_URL, {"data": query})
         elements = payload.get("elements") if isinstance(payload, dict) else None
         if not isinstance(elements, list) or not elements:
             return None, None, ""
@@ -197,10 +543,8 @@ class OSMBackend(ProviderBackend):
                 lat = center.get("lat")
                 lon = center.get("lon")
 
-        try:
-            lat_f = float(lat)
-            lon_f = float(lon)
-        except (TypeError, ValueError):
+        lat_f, lon_f = _coords(lat, lon)
+        if lat_f is None:
             return None, None, ""
 
         return lat_f, lon_f, f"{pc}, Canada"
@@ -210,10 +554,14 @@ class OSMBackend(ProviderBackend):
         if not pc:
             return ""
 
-        # Basic normalization for Canadian postal codes.
+        # Canadian postal codes are normalized to "A1A 1A1" when valid.
         if (country or "").upper() == "CA":
+            m = _CA_POSTAL_RE.match(pc)
+            if m:
+                return f"{m.group(1)} {m.group(2)}".upper()
+            # Not a valid code, but keep the "A1A 1A1" shape for six-character
+            # input so cache keys and addr:postcode matching stay the same.
             raw = pc.replace(" ", "").upper()
-            # Expected: A1A1A1
             if len(raw) == 6:
                 return raw[:3] + " " + raw[3:]
             return raw
@@ -224,112 +572,25 @@ class OSMBackend(ProviderBackend):
         raw = (postal_code or "").strip().replace(" ", "").upper()
         if not raw:
             return ""
-        first = raw[0]
-        mapping = {
-            "A": "Newfoundland and Labrador",
-            "B": "Nova Scotia",
-            "C": "Prince Edward Island",
-            "E": "New Brunswick",
-            "G": "Quebec",
-            "H": "Quebec",
-            "J": "Quebec",
-            "K": "Ontario",
-            "L": "Ontario",
-            "M": "Ontario",
-            "N": "Ontario",
-            "P": "Ontario",
-            "R": "Manitoba",
-            "S": "Saskatchewan",
-            "T": "Alberta",
-            "V": "British Columbia",
-            "X": "Northwest Territories",
-            "Y": "Yukon",
-        }
-        return mapping.get(first, "")
+        return _CA_POSTAL_FIRST_TO_PROVINCE.get(raw[0], "")
 
     def _infer_ca_province_abbrev_from_postal(self, postal_code: str) -> str:
-        full = self._infer_ca_province_from_postal(postal_code)
-        mapping = {
-            "Newfoundland and Labrador": "NL",
-            "Nova Scotia": "NS",
-            "Prince Edward Island": "PE",
-            "New Brunswick": "NB",
-            "Quebec": "QC",
-            "Ontario": "ON",
-            "Manitoba": "MB",
-            "Saskatchewan": "SK",
-            "Alberta": "AB",
-            "British Columbia": "BC",
-            "Northwest Territories": "NT",
-            "Nunavut": "NU",
-            "Yukon": "YT",
-        }
-        return mapping.get(full, "")
+        return _CA_PROVINCE_TO_ABBREV.get(self._infer_ca_province_from_postal(postal_code), "")
 
     def _normalize_ca_province(self, state: str) -> str:
         s = (state or "").strip()
         if not s:
             return ""
-        sl = s.lower()
-        # Common abbreviations and names.
-        table = {
-            "manitoba": "MB",
-            "mb": "MB",
-            "ontario": "ON",
-            "on": "ON",
-            "quebec": "QC",
-            "qc": "QC",
-            "british columbia": "BC",
-            "bc": "BC",
-            "alberta": "AB",
-            "ab": "AB",
-            "saskatchewan": "SK",
-            "sk": "SK",
-            "new brunswick": "NB",
-            "nb": "NB",
-            "nova scotia": "NS",
-            "ns": "NS",
-            "newfoundland and labrador": "NL",
-            "nl": "NL",
-            "prince edward island": "PE",
-            "pe": "PE",
-            "northwest territories": "NT",
-            "nt": "NT",
-            "nunavut": "NU",
-            "nu": "NU",
-            "yukon": "YT",
-            "yt": "YT",
-        }
-        return table.get(sl, s)
+        return _CA_STATE_NORMALIZE.get(s.lower(), s)
 
     def _country_display_name(self, country: str) -> str:
         cc = (country or "").strip().upper()
-        if cc == "CA":
-            return "Canada"
-        if cc == "US":
-            return "United States"
-        return cc
+        return _COUNTRY_DISPLAY_NAMES.get(cc, cc)
 
     def _ca_expected_province_full(self, state: str) -> str:
         """Map a Canadian province abbreviation to its full name when possible."""
 
-        ab = self._normalize_ca_province(state)
-        mapping = {
-            "MB": "Manitoba",
-            "ON": "Ontario",
-            "QC": "Quebec",
-            "BC": "British Columbia",
-            "AB": "Alberta",
-            "SK": "Saskatchewan",
-            "NB": "New Brunswick",
-            "NS": "Nova Scotia",
-            "NL": "Newfoundland and Labrador",
-            "PE": "Prince Edward Island",
-            "NT": "Northwest Territories",
-            "NU": "Nunavut",
-            "YT": "Yukon",
-        }
-        return mapping.get(ab, state)
+        return _CA_ABBREV_TO_FULL.get(self._normalize_ca_province(state), state)
 
     def _pick_best_nominatim_result(
         self,
@@ -344,51 +605,72 @@ class OSMBackend(ProviderBackend):
         cc = (country or "").strip().lower()
         st = (state or "").strip()
 
-        expected_prov_full = ""
+        expected_prov_full_lower = ""
         expected_prov_abbrev = ""
         if cc == "ca" and st:
             expected_prov_abbrev = self._normalize_ca_province(st)
-            expected_prov_full = self._ca_expected_province_full(expected_prov_abbrev)
+            expected_prov_full_lower = self._ca_expected_province_full(expected_prov_abbrev).lower()
+        check_province = bool(expected_prov_abbrev or expected_prov_full_lower)
+
+        for item in payload:
+            if not isinstance(item, dict):
+                continue
+
+            # Cheapest check first: a candidate without coordinates is useless.
+            lat, lon = _coords(item.get("lat"), item.get("lon"))
+            if lat is None:
+                continue
 
-        candidates: list[dict] = [p for p in payload if isinstance(p, dict)]
-        for item in candidates:
-            address = item.get("address") if isinstance(item.get("address"), dict) else {}
+            address = item.get("address")
+            if not isinstance(address, dict):
+                address = {}
 
             if cc:
                 addr_cc = str(address.get("country_code") or "").strip().lower()
-                if not addr_cc or addr_cc != cc:
+                if addr_cc != cc:
                     continue
 
-            if cc == "ca" and (expected_prov_full or expected_prov_abbrev):
+            if check_province:
                 addr_state = str(address.get("state") or address.get("province") or "").strip()
-                if addr_state:
-                    addr_state_norm = self._normalize_ca_province(addr_state)
-                    if expected_prov_abbrev and addr_state_norm == expected_prov_abbrev:
-                        pass
-                    elif expected_prov_full and addr_state.lower() == expected_prov_full.lower():
-                        pass
-                    else:
-                        continue
-
-            try:
-                lat = float(item.get("lat"))
-                lon = float(item.get("lon"))
-            except (TypeError, ValueError):
-                continue
+                if (
+                    addr_state
+                    and self._normalize_ca_province(addr_state) != expected_prov_abbrev
+                    and addr_state.lower() != expected_prov_full_lower
+                ):
+                    continue
 
-            display_name = str(item.get("display_name") or "")
-            return lat, lon, display_name
+            return lat, lon, str(item.get("display_name") or "")
 
         # If nothing matched constraints, fail closed.
         return None, None, ""
 
     def _geocode(self, *, city: str, state: str, postal_code: str, country: str) -> tuple[Optional[float], Optional[float], str]:
-        nominatim_url = getattr(
-            settings,
-            "OSM_NOMINATIM_URL",
-            "https://nominatim.openstreetmap.org/search",
+        """Cached wrapper around _geocode_uncached.
+
+        A location's coordinates practically never change, so hits are kept much
+        longer than POI results. Misses are cached briefly to avoid hammering
+        Nominatim with the same unresolvable input.
+        """
+        # Normalized so "Winnipeg" / "winnipeg " or "r3c0v8" / "R3C 0V8" share an entry.
+        cache_key = _cache_key(
+            prefix="osm:geo:v2",
+            payload={
+                "city": (city or "").strip().lower(),
+                "state": (state or "").strip().lower(),
+                "postal_code": self._normalize_postal_code(postal_code, country=country),
+                "country": (country or "").upper(),
+            },
         )
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
 
+        result = self._geocode_uncached(city=city, state=state, postal_code=postal_code, country=country)
+        timeout = self.GEOCODE_CACHE_TIMEOUT if result[0] is not None else 60 * 10
+        _cache_set(cache_key, result, timeout=timeout)
+        return result
+
+    def _geocode_uncached(self, *, city: str, state: str, postal_code: str, country: str) -> tuple[Optional[float], Optional[float], str]:
         cc = (country or "").strip().lower()
 
         postal_code = self._normalize_postal_code(postal_code, country=country)
@@ -398,7 +680,9 @@ class OSMBackend(ProviderBackend):
         params = {
             "format": "jsonv2",
             "limit": "5",
-            "addressdetails": "1",
+            # The address block is only read to check country/province; skip it
+            # (and the bytes) when there's nothing to check.
+            "addressdetails": "1" if cc else "0",
         }
         if len(cc) == 2:
             params["countrycodes"] = cc
@@ -423,27 +707,36 @@ class OSMBackend(ProviderBackend):
         if not q:
             return None, None, ""
         params["q"] = q
-        contact_email = getattr(settings, "OSM_CONTACT_EMAIL", "")
-        if contact_email:
-            params["email"] = contact_email
+        if _OSM_CONTACT_EMAIL:
+            params["email"] = _OSM_CONTACT_EMAIL
 
-        url = f"{nominatim_url}?{urllib.parse.urlencode(params)}"
-        payload = self._http_get_json(url)
+        payload = self._http_get_json(_OSM_NOMINATIM_URL, params=params)
         lat, lon, display_name = self._pick_best_nominatim_result(payload, country=country, state=state)
         if lat is None or lon is None:
+            # Postal-code-only CA lookups that miss here often end at the Overpass
+            # fallback. Start it only now (a started Overpass job can't be cancelled),
+            # so it overlaps the retry below instead of running on every lookup.
+            overpass_future = None
+            if postal_code and (country or "").upper() == "CA" and not city:
+                overpass_future = _EXECUTOR.submit(self._geocode_postal_via_overpass, postal_code=postal_code, country=country)
+
             # Fallback: sometimes adding the full province name helps more than the abbreviation.
             if postal_code and (country or "").upper() == "CA":
                 prov_full = self._infer_ca_province_from_postal(postal_code)
                 if prov_full and prov_full not in q:
                     params["q"] = f"{postal_code}, {prov_full}, {self._country_display_name(country)}"
-                    url = f"{nominatim_url}?{urllib.parse.urlencode(params)}"
-                    payload = self._http_get_json(url)
+                    try:
+                        payload = self._http_get_json(_OSM_NOMINATIM_URL, params=params)
+                    except Exception:
+                        if overpass_future is not None:
+                            overpass_future.cancel()
+                        raise
                     lat, lon, display_name = self._pick_best_nominatim_result(payload, country=country, state=prov_full)
 
             if lat is None or lon is None:
                 # Final fallback: use Overpass to locate any object with the postal code.
-                if postal_code and (country or "").upper() == "CA" and not city:
-                    lat, lon, display = self._geocode_postal_via_overpass(postal_code=postal_code, country=country)
+                if overpass_future is not None:
+                    lat, lon, display = overpass_future.result()
                     if lat is not None and lon is not None:
                         return lat, lon, display
 
@@ -457,71 +750,33 @@ class OSMBackend(ProviderBackend):
         lat: float,
         lon: float,
         radius_m: int,
-        tag_groups: Iterable[Iterable[tuple[str, str]]],
+        tag_groups: _TagGroups,
+        name_filter: str = "",
     ):
-        parts: list[str] = []
-        for group in tag_groups:
-            tag_filters = "".join([f"[\"{k}\"=\"{v}\"]" for k, v in group])
-            parts.append(f"node(around:{radius_m},{lat},{lon}){tag_filters};")
-            parts.append(f"way(around:{radius_m},{lat},{lon}){tag_filters};")
-            parts.append(f"relation(around:{radius_m},{lat},{lon}){tag_filters};")
-
-        body = "".join(parts)
-        return f"[out:json][timeout:25];({body});out center 120;"
+        body = "".join(
+            _OVERPASS_GROUP_TMPL.format(r=radius_m, la=lat, lo=lon, t=_overpass_tag_filter(group) + name_filter)
+            for group in tag_groups
+        )
+        return f"[out:json][timeout:25];({body});out center {self.MAX_ELEMENTS};"
 
-    def _category_to_osm_tag_groups(self, category: Optional[ServiceCategory]) -> list[list[tuple[str, str]]]:
+    def _category_to_osm_tag_groups(self, category: Optional[ServiceCategory]) -> _TagGroups:
         if not category:
-            return []
+            return ()
         slug = (category.slug or "").lower()
         name = (category.name or "").lower()
 
         key = slug or name
-        mapping: dict[str, list[list[tuple[str, str]]]] = {
-            "plumber": [[("craft", "plumber")]],
-            "electrician": [[("craft", "electrician")]],
-            "locksmith": [[("craft", "locksmith")]],
-            # Mechanics/auto shops are tagged in multiple ways; use OR groups.
-            "mechanic": [
-                [("shop", "car_repair")],
-                [("amenity", "car_repair")],
-                [("craft", "car_repair")],
-                [("service", "vehicle_repair")],
-            ],
-            "hvac": [[("craft", "hvac")]],
-            "handyman": [[("craft", "handyman")]],
-            "appliance-repair": [[("craft", "appliance_repair")]],
-            "appliance-repair-1": [[("craft", "appliance_repair")]],
-            "appliance-repair-2": [[("craft", "appliance_repair")]],
-        }
-
-        # Fallback heuristics
-        if "plumb" in key:
-            return [[("craft", "plumber")]]
-        if "electric" in key:
-            return [[("craft", "electrician")]]
-        if "lock" in key:
-            return [[("craft", "locksmith")]]
-        if "mechan" in key or "auto" in key:
-            return [
-                [("shop", "car_repair")],
-                [("amenity", "car_repair")],
-                [("craft", "car_repair")],
-                [("service", "vehicle_repair")],
-            ]
-        if "hvac" in key:
-            return [[("craft", "hvac")]]
-
-        return mapping.get(key, [])
+        return _OSM_CATEGORY_MAP.get(key) or _OSM_KEYWORD_GROUPS.get(_category_keyword(key), ())
 
     def _format_address(self, tags: dict) -> tuple[str, str, str, str, str]:
         house = tags.get("addr:housenumber") or ""
         street = tags.get("addr:street") or ""
         city = tags.get("addr:city") or ""
-        state = tags.get("addr:province") or tags.get("addr:state") or ""
+        state = _first(tags, ("addr:province", "addr:state"))
         postal_code = tags.get("addr:postcode") or ""
 
-        line1 = " ".join([p for p in [house, street] if p]).strip()
-        address = ", ".join([p for p in [line1, city, state, postal_code] if p]).strip(", ")
+        line1 = f"{house} {street}".strip()
+        address = ", ".join(p for p in (line1, city, state, postal_code) if p).strip(", ")
         return address, city, state, postal_code, ""
 
     def search(
@@ -539,58 +794,68 @@ class OSMBackend(ProviderBackend):
         if not tag_groups:
             return []
 
-        radius_km = radius_km or getattr(settings, "OSM_DEFAULT_RADIUS_KM", self.DEFAULT_RADIUS_KM)
+        radius_km = radius_km or _OSM_DEFAULT_RADIUS_KM or self.DEFAULT_RADIUS_KM
         radius_m = int(radius_km) * 1000
 
         # NOTE: Keep versioned to avoid stale cached wrong locations.
         # Use a hashed key to avoid cache backends (e.g., memcached) rejecting characters.
-        cache_key = self._cache_key(
-            prefix="osm:v4:providers",
+        # Location parts are normalized like _geocode's key, and the name filter is
+        # case-insensitive, so differently-typed equivalent searches share an entry.
+        cache_key = _cache_key(
+            prefix="osm:v7:providers",
             payload={
                 "category": (category.slug if category else "all"),
-                "query_text": query_text,
-                "city": city,
-                "state": state,
-                "postal_code": postal_code,
+                "query_text": (query_text or "").lower(),
+                "city": (city or "").strip().lower(),
+                "state": (state or "").strip().lower(),
+                "postal_code": self._normalize_postal_code(postal_code, country=country),
+                # Raw: results echo it back in ProviderResult.country.
                 "country": country,
                 "radius_km": int(radius_km),
             },
         )
-        cached = cache.get(cache_key)
+        cached = _cache_get(cache_key)
         if cached is not None:
             return cached
 
         lat, lon, _display = self._geocode(city=city, state=state, postal_code=postal_code, country=country)
         if lat is None or lon is None:
-            cache.set(cache_key, [], timeout=60 * 10)
+            _cache_set(cache_key, [], timeout=60 * 10)
             loc_hint = "city + province" if (country or "").strip().upper() == "CA" else "city/state"
             raise ProviderBackendError(
                 f"Couldn't locate that location for external results. Please add {loc_hint} (or allow device location)."
             )
 
-        overpass_url = getattr(
-            settings,
-            "OSM_OVERPASS_URL",
-            "https://overpass-api.de/api/interpreter",
+        # Let Overpass apply the name filter too, so the element cap isn't spent on
+        # non-matching POIs; the Python check below stays authoritative.
+        query = self._build_overpass_query(
+            lat=lat,
+            lon=lon,
+            radius_m=radius_m,
+            tag_groups=tag_groups,
+            name_filter=_overpass_name_filter(query_text or ""),
         )
-
-        query = self._build_overpass_query(lat=lat, lon=lon, radius_m=radius_m, tag_groups=tag_groups)
         try:
-            payload = self._http_post_form_json(overpass_url, {"data": query})
-        except urllib.error.HTTPError as e:
-            if getattr(e, "code", None) in (429, 502, 503, 504):
+            payload = self._http_post_form_json(_OSM_OVERPASS_URL, {"data": query})
+        except requests.HTTPError as e:
+            if getattr(e.response, "status_code", None) in (429, 502, 503, 504):
                 raise ProviderBackendError("External provider is temporarily busy. Please try again.")
             raise
-        except urllib.error.URLError:
+        except requests.RequestException:
             raise ProviderBackendError("External provider is temporarily unavailable.")
 
         results: list[ProviderResult] = []
         elements = payload.get("elements") if isinstance(payload, dict) else None
         if not isinstance(elements, list):
-            cache.set(cache_key, [], timeout=60 * 10)
+            _cache_set(cache_key, [], timeout=60 * 10)
             return []
 
-        for el in elements[:50]:
+        # Loop invariants; the cheapest rejections come first below.
+        query_lower = query_text.lower() if query_text else ""
+        category_name = category.name if category else ""
+        seen: set[tuple[str, str, str]] = set()
+
+        for el in islice(elements, self.MAX_ELEMENTS):
             if not isinstance(el, dict):
                 continue
             tags_dict = el.get("tags")
@@ -600,16 +865,22 @@ class OSMBackend(ProviderBackend):
             name = str(tags_dict.get("name") or "").strip()
             if not name:
                 continue
+            name_lower = name.lower()
+            if query_lower and query_lower not in name_lower:
+                continue
 
-            if query_text:
-                if query_text.lower() not in name.lower():
-                    continue
-
-            phone = str(tags_dict.get("phone") or tags_dict.get("contact:phone") or "").strip()
-            website = str(tags_dict.get("website") or tags_dict.get("contact:website") or "").strip()
+            phone = str(_first(tags_dict, ("phone", "contact:phone"))).strip()
+            website = str(_first(tags_dict, ("website", "contact:website"))).strip()
 
             address, addr_city, addr_state, addr_postal, _ = self._format_address(tags_dict)
 
+            # The same business is often mapped twice (e.g. a node and its building
+            # way); keep the first so duplicates aren't shown or cached.
+            dedupe_key = (name_lower, address.lower(), phone)
+            if dedupe_key in seen:
+                continue
+            seen.add(dedupe_key)
+
             el_lat = el.get("lat")
             el_lon = el.get("lon")
             if el_lat is None or el_lon is None:
@@ -618,17 +889,12 @@ class OSMBackend(ProviderBackend):
                     el_lat = center.get("lat")
                     el_lon = center.get("lon")
 
-            try:
-                el_lat_f = float(el_lat) if el_lat is not None else None
-                el_lon_f = float(el_lon) if el_lon is not None else None
-            except (TypeError, ValueError):
-                el_lat_f = None
-                el_lon_f = None
+            el_lat_f, el_lon_f = _coords(el_lat, el_lon)
 
             results.append(
                 ProviderResult(
                     name=name,
-                    category=category.name if category else "",
+                    category=category_name,
                     phone=phone,
                     website=website,
                     address=address,
@@ -642,7 +908,7 @@ class OSMBackend(ProviderBackend):
                 )
             )
 
-        cache.set(cache_key, results, timeout=60 * 10)
+        _cache_set(cache_key, results, timeout=_RESULTS_CACHE_TIMEOUT if results else _EMPTY_RESULTS_CACHE_TIMEOUT)
         return results
 
 
@@ -661,32 +927,21 @@ class GooglePlacesBackend(ProviderBackend):
 
     TEXTSEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
 
-    def _category_to_expected_types(self, category: Optional[ServiceCategory]) -> set[str]:
+    def __init__(self, *, provider_settings: Optional[ProviderSettings] = None):
+        # get_provider_backend() already loaded the settings row; reuse it.
+        self._provider_settings = provider_settings
+
+    def _category_to_expected_types(self, category: Optional[ServiceCategory]) -> frozenset[str]:
         if not category:
-            return set()
+            return frozenset()
         slug = (category.slug or "").lower()
         name = (category.name or "").lower()
         key = slug or name
 
-        mapping: dict[str, set[str]] = {
-            "plumber": {"plumber"},
-            "electrician": {"electrician"},
-            "locksmith": {"locksmith"},
-            "mechanic": {"car_repair"},
-        }
-
-        if "plumb" in key:
-            return {"plumber"}
-        if "electric" in key:
-            return {"electrician"}
-        if "lock" in key:
-            return {"locksmith"}
-        if "mechan" in key or "auto" in key:
-            return {"car_repair"}
-
-        return mapping.get(key, set())
+        # The shared frozensets are returned as-is; callers only intersect with them.
+        return _GOOGLE_KEYWORD_TYPES.get(_category_keyword(key)) or _GOOGLE_EXPECTED_TYPES.get(key, frozenset())
 
-    def _is_service_business(self, item: dict, *, expected_types: set[str]) -> bool:
+    def _is_service_business(self, item: dict, *, expected_types: frozenset[str]) -> bool:
         """Best-effort filter to avoid non-business / irrelevant results."""
 
         business_status = str(item.get("business_status") or "").strip()
@@ -694,34 +949,19 @@ class GooglePlacesBackend(ProviderBackend):
             return False
 
         raw_types = item.get("types")
-        types: list[str] = []
-        if isinstance(raw_types, list):
-            types = [str(t) for t in raw_types if isinstance(t, (str,))]
+        types = {t for t in raw_types if isinstance(t, str)} if isinstance(raw_types, list) else set()
 
         # Exclude common non-business / geocode artifacts.
-        blocked = {
-            "locality",
-            "postal_code",
-            "route",
-            "political",
-            "administrative_area_level_1",
-            "administrative_area_level_2",
-            "country",
-            "point_of_interest",
-        }
-        if any(t in blocked for t in types):
+        if types & _GOOGLE_BLOCKED_TYPES:
             return False
 
         if expected_types:
-            return any(t in expected_types for t in types)
+            return bool(types & expected_types)
 
         return True
 
-    def _http_get_json(self, url: str, *, timeout: int = 20) -> object:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"}, method="GET")
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            raw = resp.read().decode("utf-8")
-        return json.loads(raw)
+    def _http_get_json(self, url: str, *, params: Optional[dict[str, str]] = None, timeout: int = 20) -> object:
+        return _request_json("GET", url, params=params, headers=_JSON_HEADERS, timeout=timeout)
 
     def _build_query(self, *, category: Optional[ServiceCategory], query_text: str, location_text: str) -> str:
         parts: list[str] = []
@@ -744,10 +984,13 @@ class GooglePlacesBackend(ProviderBackend):
         country: str,
         radius_km: int,
     ) -> list[ProviderResult]:
+        if not category:
+            return []
+
         api_key = ""
         region_override = ""
         try:
-            provider_settings = ProviderSettings.get_solo()
+            provider_settings = self._provider_settings or ProviderSettings.get_solo()
             api_key = (provider_settings.google_maps_api_key or "").strip()
             region_override = (provider_settings.google_region or "").strip()
         except Exception:
@@ -759,9 +1002,6 @@ class GooglePlacesBackend(ProviderBackend):
         if not api_key:
             raise ProviderBackendError("GOOGLE_MAPS_API_KEY is not set")
 
-        if not category:
-            return []
-
         location_parts: list[str] = []
         if postal_code:
             location_parts.append(postal_code)
@@ -777,8 +1017,18 @@ class GooglePlacesBackend(ProviderBackend):
         if not query:
             return []
 
-        cache_key = f"google:textsearch:{category.slug}:{query_text}:{city}:{state}:{postal_code}:{country}".lower()
-        cached = cache.get(cache_key)
+        cache_key = _cache_key(
+            prefix="google:v2:textsearch",
+            payload={
+                "category": category.slug,
+                "query_text": (query_text or "").lower(),
+                "city": (city or "").lower(),
+                "state": (state or "").lower(),
+                "postal_code": (postal_code or "").lower(),
+                "country": (country or "").lower(),
+            },
+        )
+        cached = _cache_get(cache_key)
         if cached is not None:
             return cached
 
@@ -792,15 +1042,14 @@ class GooglePlacesBackend(ProviderBackend):
             "region": region,
             "language": "en",
         }
-        url = f"{self.TEXTSEARCH_URL}?{urllib.parse.urlencode(params)}"
-        payload = self._http_get_json(url)
+        payload = self._http_get_json(self.TEXTSEARCH_URL, params=params)
 
         if not isinstance(payload, dict):
             raise ProviderBackendError("Google Places response was not valid JSON")
 
         status = str(payload.get("status") or "")
         if status in {"ZERO_RESULTS"}:
-            cache.set(cache_key, [], timeout=60 * 10)
+            _cache_set(cache_key, [], timeout=_EMPTY_RESULTS_CACHE_TIMEOUT)
             return []
         if status not in {"OK"}:
             message = str(payload.get("error_message") or "").strip()
@@ -810,7 +1059,7 @@ class GooglePlacesBackend(ProviderBackend):
 
         results_list = payload.get("results")
         if not isinstance(results_list, list):
-            cache.set(cache_key, [], timeout=60 * 10)
+            _cache_set(cache_key, [], timeout=60 * 10)
             return []
 
         results: list[ProviderResult] = []
@@ -833,17 +1082,7 @@ class GooglePlacesBackend(ProviderBackend):
             if isinstance(geometry, dict):
                 loc = geometry.get("location")
                 if isinstance(loc, dict):
-                    try:
-                        raw_lat = loc.get("lat")
-                        raw_lng = loc.get("lng")
-
-                        if isinstance(raw_lat, (int, float, str)):
-                            lat = float(raw_lat)
-                        if isinstance(raw_lng, (int, float, str)):
-                            lon = float(raw_lng)
-                    except (TypeError, ValueError):
-                        lat = None
-                        lon = None
+                    lat, lon = _coords(loc.get("lat"), loc.get("lng"))
 
             results.append(
                 ProviderResult(
@@ -860,5 +1099,5 @@ class GooglePlacesBackend(ProviderBackend):
                 )
             )
 
-        cache.set(cache_key, results, timeout=60 * 10)
+        _cache_set(cache_key, results, timeout=_RESULTS_CACHE_TIMEOUT if results else _EMPTY_RESULTS_CACHE_TIMEOUT)
         return results
@@ -1,3 +1,147 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from .forms import ServiceSearchForm
+from .models import ServiceCategory, ServiceProvider
+from .views import _apply_location_filters, _infer_category_from_query
+
+
+class ServiceSearchFormTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.plumber = ServiceCategory.objects.create(name="Plumber")
+		self.retired = ServiceCategory.objects.create(name="Chimney Sweep", is_active=False)
+
+	def test_active_category_is_accepted(self):
+		form = ServiceSearchForm({"service_category": str(self.plumber.pk)})
+		self.assertTrue(form.is_valid())
+		self.assertEqual(form.cleaned_data["service_category"], self.plumber)
+
+	def test_inactive_category_is_rejected(self):
+		form = ServiceSearchForm({"service_category": str(self.retired.pk)})
+		self.assertFalse(form.is_valid())
+		self.assertIn("service_category", form.errors)
+
+	def test_unknown_category_is_rejected(self):
+		form = ServiceSearchForm({"service_category": "999999"})
+		self.assertFalse(form.is_valid())
+		self.assertIn("service_category", form.errors)
+
+	def test_category_deactivated_after_render_is_rejected(self):
+		# The cached choices may still list it; clean_service_category re-checks the DB.
+		form = ServiceSearchForm({"service_category": str(self.plumber.pk)})
+		ServiceCategory.objects.filter(pk=self.plumber.pk).update(is_active=False)
+		self.assertFalse(form.is_valid())
+
+
+class CategoryChoicesCacheTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.plumber = ServiceCategory.objects.create(name="Plumber")
+
+	def test_choices_are_cached(self):
+		ServiceCategory.active_choices()
+		with self.assertNumQueries(0):
+			self.assertEqual(ServiceCategory.active_choices(), [(self.plumber.pk, "Plumber")])
+
+	def test_save_invalidates_choices(self):
+		ServiceCategory.active_choices()
+		ServiceCategory.active_categories()
+		roofer = ServiceCategory.objects.create(name="Roofing")
+		self.assertIn((roofer.pk, "Roofing"), ServiceCategory.active_choices())
+		self.assertIn(roofer, ServiceCategory.active_categories())
+
+		roofer.is_active = False
+		roofer.save()
+		self.assertNotIn((roofer.pk, "Roofing"), ServiceCategory.active_choices())
+		self.assertNotIn(roofer, ServiceCategory.active_categories())
+
+	def test_delete_invalidates_choices(self):
+		ServiceCategory.active_choices()
+		ServiceCategory.active_categories()
+		self.plumber.delete()
+		self.assertEqual(ServiceCategory.active_choices(), [])
+		self.assertEqual(ServiceCategory.active_categories(), [])
+
+
+class LiveSearchShortQueryTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.plumber = ServiceCategory.objects.create(name="Plumber")
+		ServiceProvider.objects.create(
+			category=self.plumber, name="Plains Pipes", phone="204-555-0100", city="Selkirk", state="MB"
+		)
+
+	def test_short_query_without_filters_asks_for_more(self):
+		resp = self.client.get("/search/live/", {"query": "pl"})
+		self.assertTemplateUsed(resp, "directory/_live_query_too_short.html")
+		self.assertNotContains(resp, "Plains Pipes")
+		self.assertNotContains(resp, "No providers match")
+
+	def test_short_query_with_location_filter_runs(self):
+		resp = self.client.get("/search/live/", {"query": "pl", "state": "MB"})
+		self.assertTemplateUsed(resp, "directory/_live_results.html")
+		self.assertContains(resp, "Plains Pipes")
+
+	def test_short_query_with_category_runs(self):
+		resp = self.client.get("/search/live/", {"query": "p", "service_category": self.plumber.pk})
+		self.assertTemplateUsed(resp, "directory/_live_results.html")
+		self.assertContains(resp, "Plains Pipes")
+
+	def test_three_character_query_runs(self):
+		resp = self.client.get("/search/live/", {"query": "pla"})
+		self.assertTemplateUsed(resp, "directory/_live_results.html")
+		self.assertContains(resp, "Plains Pipes")
+
+
+class PostalCodeFilterTests(TestCase):
+	def setUp(self):
+		self.plumber = ServiceCategory.objects.create(name="Plumber")
+		self.spaced = ServiceProvider.objects.create(category=self.plumber, name="Spaced", postal_code="r1a 1a1")
+		self.compact = ServiceProvider.objects.create(category=self.plumber, name="Compact", postal_code="R1A1A1")
+		ServiceProvider.objects.create(category=self.plumber, name="Elsewhere", postal_code="R3C 0V8")
+
+	def test_postal_code_norm_is_stored_normalized(self):
+		self.spaced.refresh_from_db()
+		self.assertEqual(self.spaced.postal_code_norm, "R1A1A1")
+
+	def test_filter_ignores_spaces_and_case(self):
+		for entered in ("R1A 1A1", "r1a1a1", " R1A1A1 "):
+			with self.subTest(entered=entered):
+				qs = _apply_location_filters(providers=ServiceProvider.objects.all(), postal_code=entered, city="", state="")
+				self.assertQuerySetEqual(qs, ["Compact", "Spaced"], transform=lambda p: p.name, ordered=False)
+
+
+class CategoryInferenceTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.plumber = ServiceCategory.objects.create(name="Plumber")
+		self.locksmith = ServiceCategory.objects.create(name="Locksmith")
+		self.roofing = ServiceCategory.objects.create(name="Roofing")
+		self.cleaning = ServiceCategory.objects.create(name="Cleaning")
+		self.pest = ServiceCategory.objects.create(name="Pest Control")
+
+	def test_exact_name_consumes_query(self):
+		self.assertEqual(_infer_category_from_query("pest control"), (self.pest, True))
+
+	def test_keyword_maps_to_slug(self):
+		self.assertEqual(_infer_category_from_query("plumbing"), (self.plumber, True))
+
+	def test_overlapping_keywords_are_all_found(self):
+		# "cool" and "lock" overlap; hvac doesn't exist here, so lock must still match.
+		self.assertEqual(_infer_category_from_query("coolock"), (self.locksmith, True))
+
+	def test_keyword_priority_beats_position(self):
+		# "roof" ranks above "clean" even though "clean" comes first in the text.
+		self.assertEqual(_infer_category_from_query("clean the roof"), (self.roofing, True))
+
+	def test_keyword_without_category_falls_through(self):
+		self.assertEqual(_infer_category_from_query("heating"), (None, False))
+
+	def test_single_partial_name_match_keeps_query(self):
+		self.assertEqual(_infer_category_from_query("pest"), (self.pest, False))
+
+	def test_inference_reads_cached_categories(self):
+		_infer_category_from_query("plumbing")
+		with self.assertNumQueries(0):
+			_infer_category_from_query("lock")
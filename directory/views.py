@@ -2,27 +2,24 @@
 
 from __future__ import annotations
 
-import json
 import math
-import urllib.parse
-import urllib.request
-from functools import lru_cache
+import re
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import F, Q, Value
-from django.db.models.functions import Coalesce, Replace, Trim, Upper
+from django.db.models import Q, Value
+from django.db.models.functions import Coalesce, Trim
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
-from django.conf import settings
 from django.views.decorators.http import require_GET
 
 from accounts.models import UserProfile
-from analyticsapp.models import SearchEvent, UsageAction, UsageEvent
+from analyticsapp.ingest import record_search, record_usage
+from analyticsapp.models import UsageAction
 
 from .forms import LocationForm, ServiceSearchForm
 from .models import ServiceCategory, ServiceProvider
-from .provider_backends import ProviderBackendError, get_provider_backend
+from .provider_backends import ProviderBackendError, get_provider_backend, reverse_geocode
 
 
 def _haversine_km(*, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -47,7 +44,7 @@ def _sort_local_by_distance(*, providers: list[ServiceProvider], user_lat: float
 				return (1, float("inf"), (p.name or "").lower())
 			return (
 				0,
-				_haversine_km(lat1=user_lat, lon1=user_lon, lat2=float(p.latitude), lon2=float(p.longitude)),
+				_haversine_km(lat1=user_lat, lon1=user_lon, lat2=p.latitude, lon2=p.longitude),
 				(p.name or "").lower(),
 			)
 		except Exception:
@@ -77,59 +74,6 @@ def _sort_external_by_distance(*, providers: list, user_lat: float | None, user_
 	return sorted(providers, key=key)
 
 
-def _nominatim_reverse_url() -> str:
-	"""Build a Nominatim reverse endpoint URL from settings.
-
-	We keep this derived so deployments that override OSM_NOMINATIM_URL still work.
-	"""
-	base = getattr(settings, "OSM_NOMINATIM_URL", "https://nominatim.openstreetmap.org/search")
-	try:
-		parts = urllib.parse.urlsplit(str(base))
-		# Replace the path with /reverse
-		return urllib.parse.urlunsplit((parts.scheme, parts.netloc, "/reverse", "", ""))
-	except Exception:
-		return "https://nominatim.openstreetmap.org/reverse"
-
-
-@lru_cache(maxsize=256)
-def _reverse_geocode_osm(*, lat: float, lon: float) -> tuple[str, str, str]:
-	"""Best-effort reverse geocode lat/lon -> (city, state, postal_code).
-
-	Returns empty strings when unavailable.
-	"""
-	# Nominatim prefers reasonably-rounded coordinates.
-	lat_r = round(float(lat), 5)
-	lon_r = round(float(lon), 5)
-	params = {
-		"format": "jsonv2",
-		"lat": str(lat_r),
-		"lon": str(lon_r),
-		"addressdetails": "1",
-	}
-	url = _nominatim_reverse_url() + "?" + urllib.parse.urlencode(params)
-
-	headers = {
-		"Accept": "application/json",
-		"User-Agent": getattr(settings, "OSM_USER_AGENT", "local-services") or "local-services",
-	}
-	req = urllib.request.Request(url, headers=headers, method="GET")
-	with urllib.request.urlopen(req, timeout=4) as resp:
-		payload = json.loads(resp.read().decode("utf-8") or "{}")
-
-	addr = payload.get("address") or {}
-	city = (
-		addr.get("city")
-		or addr.get("town")
-		or addr.get("village")
-		or addr.get("hamlet")
-		or addr.get("suburb")
-		or ""
-	)
-	state = addr.get("state") or addr.get("province") or addr.get("region") or ""
-	postal = addr.get("postcode") or ""
-	return str(city).strip(), str(state).strip(), str(postal).strip()
-
-
 def _has_analytics_consent(request) -> bool:
 	"""Return True when user consented to analytics tracking.
 
@@ -139,6 +83,38 @@ def _has_analytics_consent(request) -> bool:
 	return val in {"1", "true", "yes", "y", "accept", "accepted"}
 
 
+def _collect_external(future) -> tuple[list, str]:
+	"""Wait for a backend.search_async() started earlier; returns (results, error)."""
+	try:
+		return future.result(), ""
+	except ProviderBackendError as e:
+		return [], str(e)
+	except Exception:
+		return [], "External provider search is temporarily unavailable."
+
+
+# Query keyword -> category slug, in priority order (first match wins).
+_QUERY_KEYWORD_SLUGS = {
+	"plumb": "plumber",
+	"electric": "electrician",
+	"lock": "locksmith",
+	"mechan": "mechanic",
+	"auto": "mechanic",
+	"hvac": "hvac",
+	"heat": "hvac",
+	"cool": "hvac",
+	"handy": "handyman",
+	"appliance": "appliance-repair",
+	"roof": "roofing",
+	"landscap": "landscaping",
+	"clean": "cleaning",
+	"move": "moving",
+}
+_QUERY_KEYWORDS = tuple(_QUERY_KEYWORD_SLUGS)
+# Lookahead so overlapping keywords ("coolock": cool, lock) are all found.
+_QUERY_KEYWORD_RE = re.compile("(?=(%s))" % "|".join(_QUERY_KEYWORDS))
+
+
 def _infer_category_from_query(query_text: str) -> tuple[ServiceCategory | None, bool]:
 	"""Infer category from a free-text query.
 
@@ -151,43 +127,57 @@ def _infer_category_from_query(query_text: str) -> tuple[ServiceCategory | None,
 	if not qt:
 		return None, False
 
-	qs = ServiceCategory.objects.filter(is_active=True)
+	# Matched in Python against the cached category list: live search calls this on
+	# every keystroke, and the list only changes when a category is edited.
+	categories = ServiceCategory.active_categories()
+	ql = qt.lower()
 
-	exact = qs.filter(name__iexact=qt).first()
+	exact = next((c for c in categories if c.name.lower() == ql), None)
 	if exact:
 		return exact, True
 
-	ql = qt.lower()
-	keyword_to_slug: list[tuple[str, str]] = [
-		("plumb", "plumber"),
-		("electric", "electrician"),
-		("lock", "locksmith"),
-		("mechan", "mechanic"),
-		("auto", "mechanic"),
-		("hvac", "hvac"),
-		("heat", "hvac"),
-		("cool", "hvac"),
-		("handy", "handyman"),
-		("appliance", "appliance-repair"),
-		("roof", "roofing"),
-		("landscap", "landscaping"),
-		("clean", "cleaning"),
-		("move", "moving"),
-	]
-	for key, slug in keyword_to_slug:
-		if key in ql:
-			cat = qs.filter(slug__iexact=slug).first() or qs.filter(name__iexact=slug.replace("-", " ")).first()
+	found = _QUERY_KEYWORD_RE.findall(ql)
+	if found:
+		by_slug = {c.slug.lower(): c for c in categories}
+		by_name = {c.name.lower(): c for c in categories}
+		# Keywords are tried in priority order; one without a category falls through.
+		for key in sorted(set(found), key=_QUERY_KEYWORDS.index):
+			slug = _QUERY_KEYWORD_SLUGS[key]
+			cat = by_slug.get(slug) or by_name.get(slug.replace("-", " "))
 			if cat:
 				return cat, True
 
 	# If there's a single obvious match, infer it.
-	contains = list(qs.filter(name__icontains=qt).order_by("sort_order", "name")[:2])
+	contains = [c for c in categories if ql in c.name.lower()][:2]
 	if len(contains) == 1:
 		return contains[0], False
 
 	return None, False
 
 
+# What the provider cards and the distance sort read; description and the
+# timestamps are never rendered in result lists.
+_PROVIDER_CARD_FIELDS = (
+	"id",
+	"name",
+	"phone",
+	"website",
+	"city",
+	"state",
+	"postal_code",
+	"latitude",
+	"longitude",
+	"is_suggested",
+	"suggested_rank",
+	"category__name",
+)
+
+
+def _active_providers():
+	"""Base queryset for result lists; cards show the category name, so join it."""
+	return ServiceProvider.objects.filter(is_active=True).select_related("category").only(*_PROVIDER_CARD_FIELDS)
+
+
 def _apply_location_filters(*, providers, postal_code: str, city: str, state: str, prefer_city_state: bool = False):
 	pc = (postal_code or "").strip()
 	ci = (city or "").strip()
@@ -203,8 +193,7 @@ def _apply_location_filters(*, providers, postal_code: str, city: str, state: st
 		pc_norm = pc.replace(" ", "").upper()
 		if pc_norm:
 			# Match regardless of spaces/case in DB (e.g. "R5G1J8" vs "R5G 1J8").
-			filtered = providers.annotate(_pc_norm=Upper(Replace(F("postal_code"), Value(" "), Value(""))))
-			filtered = filtered.filter(_pc_norm=pc_norm)
+			filtered = providers.filter(postal_code_norm=pc_norm)
 		else:
 			filtered = providers.filter(postal_code__iexact=pc)
 
@@ -219,6 +208,16 @@ def _apply_location_filters(*, providers, postal_code: str, city: str, state: st
 	return providers
 
 
+def _text_search_q(query_text: str) -> Q:
+	"""Free-text match on provider name/description or category name.
+
+	The category match is an id subquery rather than a join, so every branch of
+	the OR is a condition on the provider table and each can use its own index.
+	"""
+	category_ids = ServiceCategory.objects.filter(name__icontains=query_text).values("id")
+	return Q(name__icontains=query_text) | Q(description__icontains=query_text) | Q(category_id__in=category_ids)
+
+
 def _apply_quality_filters(providers):
 	"""Only show listings that are actually actionable.
 
@@ -257,7 +256,7 @@ def public_search(request):
 
 	profile = None
 	if request.user.is_authenticated:
-		profile, _ = UserProfile.objects.get_or_create(user=request.user)
+		profile = UserProfile.for_request(request)
 
 	location_initial = {}
 	if profile:
@@ -287,7 +286,7 @@ def public_search(request):
 	search_form = ServiceSearchForm(get_data or None)
 	location_form = LocationForm(get_data or None, initial=location_initial)
 
-	providers = ServiceProvider.objects.filter(is_active=True)
+	providers = _active_providers()
 	selected_category = None
 	query_text = ""
 	city = ""
@@ -301,6 +300,7 @@ def public_search(request):
 	external_providers = []
 	external_error = ""
 	external_source = ""
+	external_future = None
 
 	# Determine the effective filter values.
 	if search_form.is_valid():
@@ -335,7 +335,7 @@ def public_search(request):
 			try:
 				lat = float(raw_lat)
 				lon = float(raw_lon)
-				geo_city, geo_state, geo_postal = _reverse_geocode_osm(lat=lat, lon=lon)
+				geo_city, geo_state, geo_postal = reverse_geocode(lat=lat, lon=lon)
 				city = city or geo_city
 				state = state or geo_state
 				postal_code = postal_code or geo_postal
@@ -390,17 +390,13 @@ def public_search(request):
 	)
 
 	if query_text:
-		providers = providers.filter(
-			Q(name__icontains=query_text)
-			| Q(description__icontains=query_text)
-			| Q(category__name__icontains=query_text)
-		)
+		providers = providers.filter(_text_search_q(query_text))
 
 	providers = _apply_quality_filters(providers)
 
 	# Log searches when the user actually submits/loads query params (including geolocation auto-submit).
 	if request.GET and _has_analytics_consent(request):
-		SearchEvent.objects.create(
+		record_search(
 			user=request.user if request.user.is_authenticated else None,
 			service_category=selected_category,
 			query_text=query_text,
@@ -410,11 +406,12 @@ def public_search(request):
 		)
 
 		# External search is only meaningful when we have both a category and a location.
+		# It runs in the background while the local queries below hit the DB.
 		if selected_category and (postal_code or (city and state)):
 			try:
 				backend = get_provider_backend()
 				external_source = getattr(backend, "source_label", "")
-				external_providers = backend.search(
+				external_future = backend.search_async(
 					category=selected_category,
 					query_text=query_text,
 					city=city,
@@ -428,12 +425,6 @@ def public_search(request):
 			except Exception:
 				external_error = "External provider search is temporarily unavailable."
 
-	# Enforce actionable results for external providers too.
-	external_providers = [
-		p for p in external_providers if (getattr(p, "name", "") or "").strip() and (getattr(p, "phone", "") or "").strip()
-	]
-	external_providers = _sort_external_by_distance(providers=external_providers, user_lat=user_lat, user_lon=user_lon)
-
 	# Sponsored services always take priority; within each group, show closer results first when possible.
 	suggested_qs = providers.filter(is_suggested=True).order_by("suggested_rank", "name")[:50]
 	regular_qs = providers.filter(is_suggested=False).order_by("name")[:200]
@@ -441,6 +432,15 @@ def public_search(request):
 	suggested_list = list(suggested_qs)
 	regular_list = list(regular_qs)
 
+	if external_future is not None:
+		external_providers, external_error = _collect_external(external_future)
+
+	# Enforce actionable results for external providers too.
+	external_providers = [
+		p for p in external_providers if (getattr(p, "name", "") or "").strip() and (getattr(p, "phone", "") or "").strip()
+	]
+	external_providers = _sort_external_by_distance(providers=external_providers, user_lat=user_lat, user_lon=user_lon)
+
 	if user_lat is not None and user_lon is not None:
 		# Suggested keeps suggested_rank as the primary sort key.
 		suggested_list = sorted(
@@ -448,7 +448,7 @@ def public_search(request):
 			key=lambda p: (
 				p.suggested_rank,
 				0 if (p.latitude is not None and p.longitude is not None) else 1,
-				_haversine_km(lat1=user_lat, lon1=user_lon, lat2=float(p.latitude), lon2=float(p.longitude))
+				_haversine_km(lat1=user_lat, lon1=user_lon, lat2=p.latitude, lon2=p.longitude)
 				if (p.latitude is not None and p.longitude is not None)
 				else float("inf"),
 				(p.name or "").lower(),
@@ -474,6 +474,10 @@ def public_search(request):
 	)
 
 
+# Shorter queries need a category or a location filter before live search does any work.
+_LIVE_SEARCH_MIN_QUERY_LEN = 3
+
+
 @require_GET
 def live_search(request):
 	"""Live (AJAX) search results for local providers.
@@ -488,7 +492,7 @@ def live_search(request):
 	search_form = ServiceSearchForm(get_data)
 	location_form = LocationForm(get_data)
 
-	providers = ServiceProvider.objects.filter(is_active=True)
+	providers = _active_providers()
 	selected_category = None
 	query_text = ""
 	city = ""
@@ -509,6 +513,7 @@ def live_search(request):
 		postal_code = (location_form.cleaned_data.get("postal_code") or "").strip()
 		raw_lat = (location_form.cleaned_data.get("latitude") or "").strip()
 		raw_lon = (location_form.cleaned_data.get("longitude") or "").strip()
+
 		if raw_lat and raw_lon:
 			try:
 				user_lat = float(raw_lat)
@@ -530,13 +535,23 @@ def live_search(request):
 			try:
 				lat = float(raw_lat)
 				lon = float(raw_lon)
-				geo_city, geo_state, geo_postal = _reverse_geocode_osm(lat=lat, lon=lon)
+				geo_city, geo_state, geo_postal = reverse_geocode(lat=lat, lon=lon)
 				city = city or geo_city
 				state = state or geo_state
 				postal_code = postal_code or geo_postal
 			except Exception:
 				pass
 
+	# A one- or two-letter prefix with no other filter matches almost everything;
+	# ask for more input before inference or any query.
+	has_location = bool(postal_code or city or state or user_lat is not None)
+	if not selected_category and len(query_text) < _LIVE_SEARCH_MIN_QUERY_LEN and not has_location:
+		return render(
+			request,
+			"directory/_live_query_too_short.html",
+			{"min_query_length": _LIVE_SEARCH_MIN_QUERY_LEN},
+		)
+
 	had_query = bool(query_text)
 	category_explicit = bool(request.GET.get("service_category"))
 	if not selected_category and query_text:
@@ -558,48 +573,23 @@ def live_search(request):
 	)
 
 	if query_text:
-		providers = providers.filter(
-			Q(name__icontains=query_text)
-			| Q(description__icontains=query_text)
-			| Q(category__name__icontains=query_text)
-		)
+		providers = providers.filter(_text_search_q(query_text))
 
 	providers = _apply_quality_filters(providers)
 
-	# Sponsored services always take priority; then closer results.
-	suggested_qs = providers.filter(is_suggested=True).order_by("suggested_rank", "name")[:50]
-	regular_qs = providers.filter(is_suggested=False).order_by("name")[:200]
-	suggested_list = list(suggested_qs)
-	regular_list = list(regular_qs)
-
-	if user_lat is not None and user_lon is not None:
-		suggested_list = sorted(
-			suggested_list,
-			key=lambda p: (
-				p.suggested_rank,
-				0 if (p.latitude is not None and p.longitude is not None) else 1,
-				_haversine_km(lat1=user_lat, lon1=user_lon, lat2=float(p.latitude), lon2=float(p.longitude))
-				if (p.latitude is not None and p.longitude is not None)
-				else float("inf"),
-				(p.name or "").lower(),
-			),
-		)
-		regular_list = _sort_local_by_distance(providers=regular_list, user_lat=user_lat, user_lon=user_lon)
-
-	suggested_providers = suggested_list[:6]
-	providers = regular_list[:30]
-
 	external_providers = []
 	external_error = ""
 	external_source = ""
+	external_future = None
 
 	# Optional external results for live search: only when user is actively typing
 	# or explicitly selected a category, and location is present.
+	# Started first so it overlaps the local queries below.
 	if selected_category and (postal_code or (city and state)) and (had_query or category_explicit):
 		try:
 			backend = get_provider_backend()
 			external_source = getattr(backend, "source_label", "")
-			external_providers = backend.search(
+			external_future = backend.search_async(
 				category=selected_category,
 				query_text=query_text,
 				city=city,
@@ -613,6 +603,32 @@ def live_search(request):
 		except Exception:
 			external_error = "External provider search is temporarily unavailable."
 
+	# Sponsored services always take priority; then closer results.
+	suggested_qs = providers.filter(is_suggested=True).order_by("suggested_rank", "name")[:50]
+	regular_qs = providers.filter(is_suggested=False).order_by("name")[:200]
+	suggested_list = list(suggested_qs)
+	regular_list = list(regular_qs)
+
+	if user_lat is not None and user_lon is not None:
+		suggested_list = sorted(
+			suggested_list,
+			key=lambda p: (
+				p.suggested_rank,
+				0 if (p.latitude is not None and p.longitude is not None) else 1,
+				_haversine_km(lat1=user_lat, lon1=user_lon, lat2=p.latitude, lon2=p.longitude)
+				if (p.latitude is not None and p.longitude is not None)
+				else float("inf"),
+				(p.name or "").lower(),
+			),
+		)
+		regular_list = _sort_local_by_distance(providers=regular_list, user_lat=user_lat, user_lon=user_lon)
+
+	suggested_providers = suggested_list[:6]
+	providers = regular_list[:30]
+
+	if external_future is not None:
+		external_providers, external_error = _collect_external(external_future)
+
 	external_providers = [
 		p for p in external_providers if (getattr(p, "name", "") or "").strip() and (getattr(p, "phone", "") or "").strip()
 	]
@@ -639,7 +655,7 @@ def dashboard(request):
 	Also records SearchEvent ("requested" services) when searches happen.
 	"""
 
-	profile, _ = UserProfile.objects.get_or_create(user=request.user)
+	profile = UserProfile.for_request(request)
 
 	if request.method == "POST" and request.POST.get("action") == "update_location":
 		location_form = LocationForm(request.POST)
@@ -655,12 +671,13 @@ def dashboard(request):
 
 	search_form = ServiceSearchForm(request.GET or None)
 
-	providers = ServiceProvider.objects.filter(is_active=True)
+	providers = _active_providers()
 	selected_category = None
 	query_text = ""
 	external_providers = []
 	external_error = ""
 	external_source = ""
+	external_future = None
 
 	if search_form.is_valid():
 		selected_category = search_form.cleaned_data.get("service_category")
@@ -688,15 +705,11 @@ def dashboard(request):
 					query_text = ""
 
 		if query_text:
-			providers = providers.filter(
-				Q(name__icontains=query_text)
-				| Q(description__icontains=query_text)
-				| Q(category__name__icontains=query_text)
-			)
+			providers = providers.filter(_text_search_q(query_text))
 
 		# Log the search (requested services) only when user consented.
 		if _has_analytics_consent(request):
-			SearchEvent.objects.create(
+			record_search(
 				user=request.user,
 				service_category=selected_category,
 				query_text=query_text,
@@ -708,11 +721,12 @@ def dashboard(request):
 			)
 
 		# External search (free-first via OSM). Only run when the user is actively searching.
+		# It runs in the background while the local queries below hit the DB.
 		if request.GET and selected_category and (profile.postal_code or (profile.city and profile.state)):
 			try:
 				backend = get_provider_backend()
 				external_source = getattr(backend, "source_label", "")
-				external_providers = backend.search(
+				external_future = backend.search_async(
 					category=selected_category,
 					query_text=query_text,
 					city=profile.city,
@@ -726,13 +740,16 @@ def dashboard(request):
 			except Exception:
 				external_error = "External provider search is temporarily unavailable."
 
+	# Evaluated here (not lazily in the template) so they overlap the external search.
+	suggested = list(providers.filter(is_suggested=True).order_by("suggested_rank", "name")[:6])
+	regular = list(providers.filter(is_suggested=False).order_by("name")[:30])
+
+	if external_future is not None:
+		external_providers, external_error = _collect_external(external_future)
 		external_providers = [
 			p for p in external_providers if (getattr(p, "name", "") or "").strip() and (getattr(p, "phone", "") or "").strip()
 		]
 
-	suggested = providers.filter(is_suggested=True).order_by("suggested_rank", "name")[:6]
-	regular = providers.filter(is_suggested=False).order_by("name")[:30]
-
 	return render(
 		request,
 		"directory/dashboard.html",
@@ -760,10 +777,10 @@ def contact_provider(request, provider_id: int):
 		raise Http404()
 
 	provider = get_object_or_404(ServiceProvider, pk=provider_id, is_active=True)
-	profile, _ = UserProfile.objects.get_or_create(user=request.user)
+	profile = UserProfile.for_request(request)
 
 	if _has_analytics_consent(request):
-		UsageEvent.objects.create(
+		record_usage(
 			user=request.user,
 			service_category=provider.category,
 			provider=provider,
@@ -790,9 +807,9 @@ def provider_out(request, provider_id: int):
 	if not provider.website:
 		raise Http404()
 
-	profile, _ = UserProfile.objects.get_or_create(user=request.user)
+	profile = UserProfile.for_request(request)
 	if _has_analytics_consent(request):
-		UsageEvent.objects.create(
+		record_usage(
 			user=request.user,
 			service_category=provider.category,
 			provider=provider,